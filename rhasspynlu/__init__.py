@@ -1,19 +1,94 @@
 """Utilities for Rhasspy natural language understanding."""
-from .arpa_lm import arpa_to_fst, fst_to_arpa, graph_to_arpa, graph_to_arpa_small
-from .evaluate import evaluate_intents
-from .fsticuffs import recognize
-from .g2p import PronunciationsType, guess_pronunciations, read_pronunciations
-from .ini_jsgf import parse_ini
-from .jsgf import Rule, Sentence
-from .jsgf_graph import (
-    graph_to_fst,
-    graph_to_gzip_pickle,
-    graph_to_json,
-    gzip_pickle_to_graph,
-    intents_to_graph,
-    json_to_graph,
-    sentences_to_graph,
-)
-from .ngram import get_intent_ngram_counts
-from .numbers import number_range_transform, number_transform, replace_numbers
-from .slots import get_slot_replacements
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .arpa_lm import arpa_to_fst, fst_to_arpa, graph_to_arpa, graph_to_arpa_small
+    from .evaluate import evaluate_intents
+    from .fsticuffs import recognize
+    from .g2p import PronunciationsType, guess_pronunciations, read_pronunciations
+    from .ini_jsgf import parse_ini
+    from .jsgf import Rule, Sentence
+    from .jsgf_graph import (
+        graph_to_fst,
+        graph_to_gzip_pickle,
+        graph_to_json,
+        gzip_pickle_to_graph,
+        intents_to_graph,
+        json_to_graph,
+        sentences_to_graph,
+    )
+    from .ngram import get_intent_ngram_counts
+    from .numbers import number_range_transform, number_transform, replace_numbers
+    from .slots import get_slot_replacements
+
+# Public name -> submodule it is imported from.
+# Submodules are only imported on first access, so importing a lightweight
+# module (e.g., rhasspynlu.jsgf) does not pull in networkx.
+_LAZY_IMPORTS = {
+    "arpa_to_fst": "arpa_lm",
+    "fst_to_arpa": "arpa_lm",
+    "graph_to_arpa": "arpa_lm",
+    "graph_to_arpa_small": "arpa_lm",
+    "evaluate_intents": "evaluate",
+    "recognize": "fsticuffs",
+    "PronunciationsType": "g2p",
+    "guess_pronunciations": "g2p",
+    "read_pronunciations": "g2p",
+    "parse_ini": "ini_jsgf",
+    "Rule": "jsgf",
+    "Sentence": "jsgf",
+    "graph_to_fst": "jsgf_graph",
+    "graph_to_gzip_pickle": "jsgf_graph",
+    "graph_to_json": "jsgf_graph",
+    "gzip_pickle_to_graph": "jsgf_graph",
+    "intents_to_graph": "jsgf_graph",
+    "json_to_graph": "jsgf_graph",
+    "sentences_to_graph": "jsgf_graph",
+    "get_intent_ngram_counts": "ngram",
+    "number_range_transform": "numbers",
+    "number_transform": "numbers",
+    "replace_numbers": "numbers",
+    "get_slot_replacements": "slots",
+}
+
+# Submodules that are available as attributes (e.g., rhasspynlu.intent)
+_SUBMODULES = {
+    "arpa_lm",
+    "const",
+    "evaluate",
+    "fsticuffs",
+    "g2p",
+    "g2p_geepers",
+    "ini_jsgf",
+    "intent",
+    "jsgf",
+    "jsgf_graph",
+    "ngram",
+    "numbers",
+    "slots",
+    "utils",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import public names and submodules on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache so __getattr__ is not called again
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    """Include lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,8 @@
 """Methods for evaluating recognition results."""
 import logging
 import typing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 
 from .intent import Recognition
@@ -90,12 +92,22 @@ class TestReport:
 
 
 def evaluate_intents(
-    expected: typing.Dict[str, Recognition], actual: typing.Dict[str, Recognition]
+    expected: typing.Dict[str, Recognition],
+    actual: typing.Dict[str, Recognition],
+    workers: int = 1,
 ) -> TestReport:
-    """Generate report of comparison between expected and actual recognition results."""
+    """Generate report of comparison between expected and actual recognition results.
+
+    If workers > 1, word errors are computed in a process pool.
+    """
     # Actual intents and extra info about missing entities, etc.
     report = TestReport(expected=dict(expected))
 
+    # Pre-compute word errors in parallel
+    word_errors: typing.Dict[str, WordError] = {}
+    if workers > 1:
+        word_errors = _get_word_errors_parallel(expected, actual, workers)
+
     # Real time vs transcription time
     speedups = []
 
@@ -129,13 +141,10 @@ def evaluate_intents(
                 intents_match = expected_intent.intent.name == actual_intent.intent.name
 
             # Count entities
-            expected_entities: typing.List[typing.Tuple[str, str]] = []
-            num_expected_entities = 0
-            for entity in expected_intent.entities:
-                report.num_entities += 1
-                num_expected_entities += 1
-                entity_tuple = (entity.entity, entity.value)
-                expected_entities.append(entity_tuple)
+            expected_entities: typing.List[typing.Tuple[str, typing.Any]] = [
+                (entity.entity, entity.value) for entity in expected_intent.entities
+            ]
+            report.num_entities += len(expected_entities)
 
             # Verify actual entities.
             # Only check entities if intent was correct.
@@ -144,23 +153,18 @@ def evaluate_intents(
 
             if intents_match:
                 report.correct_intent_names += 1
-                num_actual_entities = 0
-                for entity in actual_intent.entities:
-                    num_actual_entities += 1
-                    entity_tuple = (entity.entity, entity.value)
+                actual_entities = [
+                    (entity.entity, entity.value) for entity in actual_intent.entities
+                ]
 
-                    if entity_tuple in expected_entities:
-                        report.correct_entities += 1
-                        expected_entities.remove(entity_tuple)
-                    else:
-                        wrong_entities.append(entity_tuple)
-
-                # Anything left is missing
-                missing_entities = expected_entities
+                num_correct, wrong_entities, missing_entities = _match_entities(
+                    expected_entities, actual_entities
+                )
+                report.correct_entities += num_correct
 
                 # Check if entities matched *exactly*
-                if (not expected_entities) and (
-                    num_actual_entities == num_expected_entities
+                if (not missing_entities) and (
+                    len(actual_entities) == len(expected_entities)
                 ):
                     report.correct_intent_and_entities += 1
 
@@ -175,7 +179,9 @@ def evaluate_intents(
 
         # Compute word error
         if expected_text:
-            word_error = get_word_error(expected_text.split(), actual_text.split())
+            word_error = word_errors.get(wav_name) or get_word_error(
+                expected_text.split(), actual_text.split()
+            )
             report.num_words += word_error.words
             report.correct_words += word_error.words - word_error.errors
 
@@ -211,10 +217,116 @@ def evaluate_intents(
     return report
 
 
+def _get_word_errors_parallel(
+    expected: typing.Dict[str, Recognition],
+    actual: typing.Dict[str, Recognition],
+    workers: int,
+) -> typing.Dict[str, WordError]:
+    """Compute word errors for all transcriptions using a process pool."""
+    wav_names: typing.List[str] = []
+    word_lists: typing.List[typing.Tuple[typing.List[str], typing.List[str]]] = []
+    for wav_name, actual_intent in actual.items():
+        expected_intent = expected[wav_name]
+        actual_text = actual_intent.raw_text or actual_intent.text
+        expected_text = expected_intent.raw_text or expected_intent.text
+        if expected_text:
+            wav_names.append(wav_name)
+            word_lists.append((expected_text.split(), actual_text.split()))
+
+    if not word_lists:
+        return {}
+
+    chunksize = max(1, len(word_lists) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_get_word_error_star, word_lists, chunksize=chunksize)
+
+        return dict(zip(wav_names, results))
+
+
+def _get_word_error_star(
+    words: typing.Tuple[typing.List[str], typing.List[str]]
+) -> WordError:
+    """Call get_word_error with (reference, hypothesis) tuple (picklable)."""
+    return get_word_error(*words)
+
+
+def _match_entities(
+    expected_entities: typing.List[typing.Tuple[str, typing.Any]],
+    actual_entities: typing.List[typing.Tuple[str, typing.Any]],
+) -> typing.Tuple[
+    int,
+    typing.List[typing.Tuple[str, typing.Any]],
+    typing.List[typing.Tuple[str, typing.Any]],
+]:
+    """Match actual against expected entity/value pairs (as multisets).
+
+    Returns number correct, wrong (actual only), and missing (expected only).
+    """
+    try:
+        remaining = Counter(expected_entities)
+    except TypeError:
+        # Unhashable entity value (e.g., dict)
+        return _match_entities_slow(expected_entities, actual_entities)
+
+    num_correct = 0
+    wrong_entities = []
+    for entity_tuple in actual_entities:
+        try:
+            is_expected = remaining[entity_tuple] > 0
+        except TypeError:
+            return _match_entities_slow(expected_entities, actual_entities)
+
+        if is_expected:
+            num_correct += 1
+            remaining[entity_tuple] -= 1
+        else:
+            wrong_entities.append(entity_tuple)
+
+    # Anything left is missing.
+    # Matches consume the earliest expected occurrence, so keep the last ones.
+    missing_entities = []
+    for entity_tuple in reversed(expected_entities):
+        if remaining[entity_tuple] > 0:
+            remaining[entity_tuple] -= 1
+            missing_entities.append(entity_tuple)
+
+    missing_entities.reverse()
+
+    return num_correct, wrong_entities, missing_entities
+
+
+def _match_entities_slow(
+    expected_entities: typing.List[typing.Tuple[str, typing.Any]],
+    actual_entities: typing.List[typing.Tuple[str, typing.Any]],
+) -> typing.Tuple[
+    int,
+    typing.List[typing.Tuple[str, typing.Any]],
+    typing.List[typing.Tuple[str, typing.Any]],
+]:
+    """Match entity/value pairs by list search (works for unhashable values)."""
+    missing_entities = list(expected_entities)
+    num_correct = 0
+    wrong_entities = []
+    for entity_tuple in actual_entities:
+        if entity_tuple in missing_entities:
+            num_correct += 1
+            missing_entities.remove(entity_tuple)
+        else:
+            wrong_entities.append(entity_tuple)
+
+    return num_correct, wrong_entities, missing_entities
+
+
 # -----------------------------------------------------------------------------
 
 # Reference: https://github.com/jtsi/asr-wer
 
+# Alignment operations recorded during word error computation
+_OP_MATCH = 0
+_OP_SUBSTITUTION = 1
+_OP_DELETION = 2
+_OP_INSERTION = 3
+
 
 def get_word_error(
     reference: typing.List[str], hypothesis: typing.List[str]
@@ -264,15 +376,34 @@ def get_word_error(
     #            * top cell + 1 (representing insertion)
     #       value of the smallest of the three
     #
+    # The operation that produced each cell's value is recorded as well (one
+    # byte per cell), so the alignment can be traced back without
+    # re-checking neighboring cells.
+    #
+    ops = [bytearray(cols) for _ in range(rows)]
+
     for row in range(1, rows):
+        hyp_word = hypothesis[row - 1]
+        m_row, m_prev_row, ops_row = m[row], m[row - 1], ops[row]
         for col in range(1, cols):
-            if reference[col - 1] == hypothesis[row - 1]:
-                m[row][col] = m[row - 1][col - 1]
+            if reference[col - 1] == hyp_word:
+                m_row[col] = m_prev_row[col - 1]
+                ops_row[col] = _OP_MATCH
             else:
-                substitution = m[row - 1][col - 1] + 1
-                insertion = m[row][col - 1] + 1
-                deletion = m[row - 1][col] + 1
-                m[row][col] = min(substitution, insertion, deletion)
+                substitution = m_prev_row[col - 1] + 1
+                deletion = m_row[col - 1] + 1
+                insertion = m_prev_row[col] + 1
+
+                # Prefer substitution, then deletion, then insertion
+                if (substitution <= deletion) and (substitution <= insertion):
+                    m_row[col] = substitution
+                    ops_row[col] = _OP_SUBSTITUTION
+                elif deletion <= insertion:
+                    m_row[col] = deletion
+                    ops_row[col] = _OP_DELETION
+                else:
+                    m_row[col] = insertion
+                    ops_row[col] = _OP_INSERTION
 
     # and the minimum-edit distance is simply the value of the down-right most
     # cell
@@ -286,18 +417,16 @@ def get_word_error(
     substitutions = 0
     insertions = 0
     deletions = 0
-    while True:
-        if (ref_index <= 0) or (hyp_index <= 0):
-            break
-
-        if reference[ref_index - 1] == hypothesis[hyp_index - 1]:
+    while (ref_index > 0) and (hyp_index > 0):
+        op = ops[hyp_index][ref_index]
+        if op == _OP_MATCH:
             # Match
             matches += 1
             same_word = hypothesis[hyp_index - 1]
             differences.append(same_word)
             ref_index -= 1
             hyp_index -= 1
-        elif m[hyp_index][ref_index] == (m[hyp_index - 1][ref_index - 1] + 1):
+        elif op == _OP_SUBSTITUTION:
             # Substitution
             substitutions += 1
             ref_word = reference[ref_index - 1]
@@ -305,21 +434,18 @@ def get_word_error(
             differences.append(f"{ref_word}:{hyp_word}")
             ref_index -= 1
             hyp_index -= 1
-        elif m[hyp_index][ref_index] == (m[hyp_index][ref_index - 1] + 1):
+        elif op == _OP_DELETION:
             # Deletion
             deletions += 1
             ref_word = reference[ref_index - 1]
             differences.append(f"-{ref_word}")
             ref_index -= 1
-        elif m[hyp_index][ref_index] == (m[hyp_index - 1][ref_index] + 1):
+        else:
             # Insertion
             insertions += 1
             hyp_word = hypothesis[hyp_index - 1]
             differences.append(f"+{hyp_word}")
             hyp_index -= 1
-        else:
-            _LOGGER.warning("get_word_error: malformed matrix")
-            break
 
     # error = (S + D + I) / N
     error_rate = (substitutions + deletions + insertions) / len(reference)
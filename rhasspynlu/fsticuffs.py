@@ -4,7 +4,7 @@ import itertools
 import random
 import time
 import typing
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -14,6 +14,8 @@ from .intent import Entity, Intent, Recognition, RecognitionResult
 from .jsgf_graph import get_start_end_nodes
 from .utils import pairwise
 
+_NO_STOP_WORDS: typing.FrozenSet[str] = frozenset()
+
 # -----------------------------------------------------------------------------
 
 PathNodeType = typing.Union[int, typing.Tuple[int, typing.List[str]]]
@@ -24,7 +26,7 @@ def recognize(
     tokens: typing.Union[str, typing.List[str]],
     graph: nx.DiGraph,
     fuzzy: bool = True,
-    stop_words: typing.Optional[typing.Set[str]] = None,
+    stop_words: typing.Optional[typing.AbstractSet[str]] = None,
     intent_filter: typing.Optional[typing.Callable[[str], bool]] = None,
     word_transform: typing.Optional[typing.Callable[[str], str]] = None,
     converters: typing.Optional[
@@ -33,10 +35,14 @@ def recognize(
     extra_converters: typing.Optional[
         typing.Dict[str, typing.Callable[..., typing.Any]]
     ] = None,
+    record_times: bool = True,
     **search_args,
 ) -> typing.List[Recognition]:
-    """Recognize one or more intents from tokens or a sentence."""
-    start_time = time.perf_counter()
+    """Recognize one or more intents from tokens or a sentence.
+
+    If record_times is False, recognize_seconds is left at zero.
+    """
+    start_time = time.perf_counter() if record_times else 0.0
 
     if isinstance(tokens, str):
         # Assume whitespace separation
@@ -55,7 +61,7 @@ def recognize(
             )
         )
 
-        end_time = time.perf_counter()
+        end_time = time.perf_counter() if record_times else 0.0
 
         if best_fuzzy:
             recognitions = []
@@ -100,7 +106,7 @@ def recognize(
                 )
             )
 
-        end_time = time.perf_counter()
+        end_time = time.perf_counter() if record_times else 0.0
         recognitions = []
         for path in paths:
             result, recognition = path_to_recognition(
@@ -123,7 +129,7 @@ def recognize(
 def paths_strict(
     tokens: typing.List[str],
     graph: nx.DiGraph,
-    exclude_tokens: typing.Optional[typing.Set[str]] = None,
+    exclude_tokens: typing.Optional[typing.AbstractSet[str]] = None,
     max_paths: typing.Optional[int] = None,
     intent_filter: typing.Optional[typing.Callable[[str], bool]] = None,
     word_transform: typing.Optional[typing.Callable[[str], str]] = None,
@@ -145,19 +151,23 @@ def paths_strict(
     # Number of matching paths found
     paths_found: int = 0
 
+    # Transform input tokens once up front instead of once per edge
+    num_tokens = len(tokens)
+    transformed_tokens = [word_transform(t) for t in tokens]
+
     # Do breadth-first search.
     # Queue contains items of the form:
     # * current node (int)
     # * current path (int, str?) - node, matching input token
-    # * remaining input tokens
-    node_queue: typing.List[typing.Tuple[int, PathType, typing.List[str]]] = [
-        (start_node, [], tokens)
-    ]
+    # * index of next input token
+    node_queue: typing.Deque[typing.Tuple[int, PathType, int]] = deque(
+        [(start_node, [], 0)]
+    )
 
     while node_queue:
-        current_node, current_path, current_tokens = node_queue.pop(0)
+        current_node, current_path, token_index = node_queue.popleft()
         is_final = n_data[current_node].get("final", False)
-        if is_final and (not current_tokens):
+        if is_final and (token_index >= num_tokens):
             # Reached final state
             paths_found += 1
             yield current_path
@@ -166,8 +176,7 @@ def paths_strict(
                 break
 
         for next_node, edge_data in graph[current_node].items():
-            next_path = list(current_path)
-            next_tokens = list(current_tokens)
+            next_token_index = token_index
 
             ilabel = edge_data.get("ilabel", "")
             olabel = edge_data.get("olabel", "")
@@ -182,24 +191,25 @@ def paths_strict(
             if ilabel:
                 ilabel = word_transform(ilabel)
 
-                if next_tokens:
+                if token_index < num_tokens:
                     # Failed to match input label
-                    if ilabel != word_transform(next_tokens[0]):
+                    if ilabel != transformed_tokens[token_index]:
                         if (not exclude_tokens) or (ilabel not in exclude_tokens):
                             # Can't exclude
                             continue
                     else:
                         # Token match
-                        matching_token = next_tokens.pop(0)
-                        matching_tokens.append(matching_token)
+                        matching_tokens.append(tokens[token_index])
+                        next_token_index += 1
                 else:
                     # Ran out of tokens
                     continue
 
+            next_path = list(current_path)
             next_path.append((current_node, matching_tokens))
 
             # Continue search
-            node_queue.append((next_node, next_path, next_tokens))
+            node_queue.append((next_node, next_path, next_token_index))
 
     # No results
     return []
@@ -223,7 +233,7 @@ class FuzzyCostInput:
 
     ilabel: str
     tokens: typing.List[str]
-    stop_words: typing.Set[str]
+    stop_words: typing.AbstractSet[str]
     word_transform: typing.Optional[typing.Callable[[str], str]] = None
 
 
@@ -247,21 +257,30 @@ def default_fuzzy_cost(cost_input: FuzzyCostInput) -> FuzzyCostOutput:
 
     if ilabel:
         ilabel = word_transform(ilabel)
-        while tokens and (ilabel != word_transform(tokens[0])):
-            bad_token = word_transform(tokens.pop(0))
-            if bad_token in stop_words:
+
+        # Skip tokens up to the first match (transforming each only once)
+        num_skipped = 0
+        for token in tokens:
+            token = word_transform(token)
+            if token == ilabel:
+                break
+
+            if token in stop_words:
                 # Marginal cost to ensure paths matching stop words are preferred
                 cost += 0.1
             else:
                 # Mismatched token
                 cost += 1
 
-        if tokens and (ilabel == word_transform(tokens[0])):
-            # Consume matching token
-            matching_token = tokens.pop(0)
-            matching_tokens.append(matching_token)
+            num_skipped += 1
+
+        if num_skipped < len(tokens):
+            # Consume skipped tokens and matching token
+            matching_tokens.append(tokens[num_skipped])
+            del tokens[: num_skipped + 1]
         else:
             # No matching token
+            tokens.clear()
             return FuzzyCostOutput(cost=cost, continue_search=False)
 
     return FuzzyCostOutput(cost=cost, matching_tokens=matching_tokens)
@@ -270,7 +289,7 @@ def default_fuzzy_cost(cost_input: FuzzyCostInput) -> FuzzyCostOutput:
 def paths_fuzzy(
     tokens: typing.List[str],
     graph: nx.DiGraph,
-    stop_words: typing.Optional[typing.Set[str]] = None,
+    stop_words: typing.Optional[typing.AbstractSet[str]] = None,
     cost_function: typing.Optional[
         typing.Callable[[FuzzyCostInput], FuzzyCostOutput]
     ] = None,
@@ -283,7 +302,7 @@ def paths_fuzzy(
 
     intent_filter = intent_filter or (lambda x: True)
     cost_function = cost_function or default_fuzzy_cost
-    stop_words = stop_words or set()
+    stop_words = stop_words or _NO_STOP_WORDS
 
     # node -> attrs
     n_data = graph.nodes(data=True)
@@ -300,9 +319,9 @@ def paths_fuzzy(
     best_cost: float = float(len(n_data))
 
     # (node, in_tokens, out_path, out_count, cost, intent_name)
-    node_queue: typing.List[
+    node_queue: typing.Deque[
         typing.Tuple[int, typing.List[str], PathType, int, float, typing.Optional[str]]
-    ] = [(start_node, tokens, [], 0, 0.0, None)]
+    ] = deque([(start_node, tokens, [], 0, 0.0, None)])
 
     # BFS it up
     while node_queue:
@@ -313,7 +332,7 @@ def paths_fuzzy(
             q_out_count,
             q_cost,
             q_intent,
-        ) = node_queue.pop(0)
+        ) = node_queue.popleft()
         is_final: bool = n_data[q_node].get("final", False)
 
         # Update best intent cost on final state.
@@ -357,8 +376,6 @@ def paths_fuzzy(
         for next_node, edge_data in graph[q_node].items():
             in_label = edge_data.get("ilabel") or ""
             out_label = edge_data.get("olabel") or ""
-            next_in_tokens = list(q_in_tokens)
-            next_out_path = list(q_out_path)
             next_out_count = q_out_count
             next_cost = q_cost
             next_intent = q_intent
@@ -372,6 +389,8 @@ def paths_fuzzy(
                 elif out_label[:2] != "__":
                     next_out_count += 1
 
+            # Cost function consumes tokens from its own copy
+            next_in_tokens = list(q_in_tokens)
             cost_output = cost_function(
                 FuzzyCostInput(
                     ilabel=in_label,
@@ -386,7 +405,8 @@ def paths_fuzzy(
             if not cost_output.continue_search:
                 continue
 
-            # Extend current path
+            # Extend current path (only copied for edges that are followed)
+            next_out_path = list(q_out_path)
             next_out_path.append((q_node, cost_output.matching_tokens))
 
             node_queue.append(
@@ -15,6 +15,9 @@ PronunciationsType = typing.Dict[str, typing.List[typing.List[str]]]
 
 _LOGGER = logging.getLogger(__name__)
 
+# Separator for pronunciation dictionary lines
+_PRONUNCIATION_SPLIT = re.compile(r"[ \t]+")
+
 # -----------------------------------------------------------------------------
 
 
@@ -58,9 +61,9 @@ def read_pronunciations(
 
         try:
             # Use explicit whitespace (avoid 0xA0)
-            word, *pronounce = re.split(r"[ \t]+", line)
+            word, *pronounce = _PRONUNCIATION_SPLIT.split(line)
 
-            word = word.split("(")[0]
+            word = word.partition("(")[0]
             has_word = word in word_dict
             word_action = word_actions.get(word, action)
 
@@ -356,7 +359,7 @@ def load_sounds_like(
                 # word_prons: typing.List[typing.List[typing.List[str]]] = []
                 for word_phonemes in itertools.product(*known_phonemes):
                     # Generate all possible pronunciations.
-                    word_pron = list(itertools.chain(*word_phonemes))
+                    word_pron = list(itertools.chain.from_iterable(word_phonemes))
                     has_word = unknown_word in pronunciations
 
                     # Handle according to custom words action
@@ -433,43 +436,49 @@ def get_aligned_phonemes(
         # word(N)
         word, word_index = (match.group(1), int(match.group(2)))
 
-    # Loop through possible alignments for this word
-    for io_index, inputs_outputs in enumerate(g2p_alignment.get(word, [])):
-        if (word_index is not None) and (word_index != (io_index + 1)):
-            continue
+    alignments = g2p_alignment.get(word, [])
+    if word_index is not None:
+        # Only the Nth (1-based) alignment
+        alignments = alignments[word_index - 1 : word_index] if word_index > 0 else []
 
+    num_prefix = len(prefix)
+    num_body = len(body)
+
+    # Loop through possible alignments for this word
+    for inputs_outputs in alignments:
         can_match = True
-        prefix_chars = list(prefix)
-        body_chars = list(body)
+        prefix_index = 0
+        body_index = 0
 
         phonemes = []
         for word_input, word_output in inputs_outputs:
-            word_input = list(word_input)
-            word_output = list(word_output)
+            input_index = 0
+            output_index = 0
+            num_inputs = len(word_input)
 
-            while prefix_chars and word_input:
+            while (prefix_index < num_prefix) and (input_index < num_inputs):
                 # Exhaust characters before desired word segment first
-                if word_input[0] != prefix_chars[0]:
+                if word_input[input_index] != prefix[prefix_index]:
                     can_match = False
                     break
 
-                prefix_chars = prefix_chars[1:]
-                word_input = word_input[1:]
+                prefix_index += 1
+                input_index += 1
 
-            while body_chars and word_input:
+            while (body_index < num_body) and (input_index < num_inputs):
                 # Match desired word segment
-                if word_input[0] != body_chars[0]:
+                if word_input[input_index] != body[body_index]:
                     can_match = False
                     break
 
-                body_chars = body_chars[1:]
-                word_input = word_input[1:]
+                body_index += 1
+                input_index += 1
 
-                if word_output:
-                    phonemes.append(word_output[0])
-                    word_output = word_output[1:]
+                if output_index < len(word_output):
+                    phonemes.append(word_output[output_index])
+                    output_index += 1
 
-            if not can_match or not body_chars:
+            if not can_match or (body_index >= num_body):
                 # Mismatch or done with word segment
                 break
 
@@ -1,10 +1,13 @@
 """Parsing code for ini/JSGF grammars."""
 import configparser
+import functools
 import io
 import logging
+import operator
 import re
 import typing
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -60,13 +63,21 @@ class Grammar:
 # -----------------------------------------------------------------------------
 
 
+# (is_rule, text, metadata) for a single ini line
+_ExpressionText = typing.Tuple[bool, str, ParseMetadata]
+
+
 def parse_ini(
     source: typing.Union[str, Path, typing.TextIO],
     intent_filter: typing.Optional[typing.Callable[[str], bool]] = None,
     sentence_transform: typing.Callable[[str], str] = None,
     file_name: typing.Optional[str] = None,
+    workers: int = 1,
 ) -> IntentsType:
-    """Parse multiple JSGF grammars from an ini file."""
+    """Parse multiple JSGF grammars from an ini file.
+
+    If workers > 1, intent sections are parsed in a process pool.
+    """
     intent_filter = intent_filter or (lambda x: True)
     if isinstance(source, str):
         source = io.StringIO(source)
@@ -80,6 +91,9 @@ def parse_ini(
     # Process configuration sections
     sentences: IntentsType = defaultdict(list)
 
+    # (intent name, sentences/rules) for each section
+    sections: typing.List[typing.Tuple[str, typing.List[_ExpressionText]]] = []
+
     try:
         # Create ini parser
         config = configparser.ConfigParser(
@@ -104,7 +118,14 @@ def parse_ini(
             line_number += 1
 
             # Processs settings (sentences/rules)
+            section_exprs: typing.List[_ExpressionText] = []
             for k, v in config[sec_name].items():
+                metadata = ParseMetadata(
+                    file_name=file_name,
+                    line_number=line_number,
+                    intent_name=sec_name,
+                )
+
                 if v is None:
                     # Collect non-valued keys as sentences
                     sentence = k.strip()
@@ -116,16 +137,7 @@ def parse_ini(
                         # Do transform
                         sentence = sentence_transform(sentence)
 
-                    sentences[sec_name].append(
-                        Sentence.parse(
-                            sentence,
-                            metadata=ParseMetadata(
-                                file_name=file_name,
-                                line_number=line_number,
-                                intent_name=sec_name,
-                            ),
-                        )
-                    )
+                    section_exprs.append((False, sentence, metadata))
                 else:
                     sentence = v.strip()
 
@@ -139,28 +151,53 @@ def parse_ini(
                     # Fix \[ escape sequence
                     rule = rule.replace("\\[", "[")
 
-                    sentences[sec_name].append(
-                        Rule.parse(
-                            rule,
-                            metadata=ParseMetadata(
-                                file_name=file_name,
-                                line_number=line_number,
-                                intent_name=sec_name,
-                            ),
-                        )
-                    )
+                    section_exprs.append((True, rule, metadata))
 
                 # Sentence
                 line_number += 1
 
+            sections.append((sec_name, section_exprs))
+
             # Blank line
             line_number += 1
     finally:
         source.close()
 
+    # Parse sentences/rules
+    if workers > 1:
+        chunksize = max(1, len(sections) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            section_results = list(
+                executor.map(
+                    _parse_expressions,
+                    [section_exprs for _, section_exprs in sections],
+                    chunksize=chunksize,
+                )
+            )
+    else:
+        section_results = [
+            _parse_expressions(section_exprs) for _, section_exprs in sections
+        ]
+
+    for (sec_name, _), section_sentences in zip(sections, section_results):
+        if section_sentences:
+            sentences[sec_name].extend(section_sentences)
+
     return sentences
 
 
+def _parse_expressions(
+    expr_texts: typing.List[_ExpressionText],
+) -> typing.List[typing.Union[Sentence, Rule]]:
+    """Parse the sentences/rules of a single intent section."""
+    return [
+        Rule.parse(text, metadata=metadata)
+        if is_rule
+        else Sentence.parse(text, metadata=metadata)
+        for is_rule, text, metadata in expr_texts
+    ]
+
+
 # -----------------------------------------------------------------------------
 
 
@@ -172,7 +209,8 @@ def split_rules(
     replacements = replacements or {}
 
     for intent_name, intent_exprs in intents.items():
-        sentences[intent_name] = []
+        intent_sentences: typing.List[Sentence] = []
+        sentences[intent_name] = intent_sentences
 
         # Extract rules and fold them into replacements
         for expr in intent_exprs:
@@ -184,7 +222,7 @@ def split_rules(
                 rule_name = f"<{intent_name}.{rule_name}>"
                 replacements[rule_name] = [expr.rule_body]
             else:
-                sentences[intent_name].append(expr)
+                intent_sentences.append(expr)
 
     return sentences, replacements
 
@@ -201,13 +239,20 @@ def get_intent_counts(
     """Get number of possible sentences for each intent."""
     intent_counts: typing.Dict[str, int] = defaultdict(int)
 
+    # Shared across all sentences so each rule/slot is only counted once
+    key_counts: typing.Dict[str, int] = {}
+
     for intent_name, intent_sentences in sentences.items():
         # Compute counts for all sentences
         intent_counts[intent_name] = max(
             1,
             sum(
-                get_expression_count(
-                    s, replacements, exclude_slots=exclude_slots, count_dict=count_dict
+                _get_expression_count(
+                    s,
+                    replacements,
+                    exclude_slots=exclude_slots,
+                    count_dict=count_dict,
+                    key_counts=key_counts,
                 )
                 for s in intent_sentences
             ),
@@ -226,80 +271,122 @@ def get_expression_count(
     count_dict: typing.Optional[typing.Dict[Expression, int]] = None,
 ) -> int:
     """Get the number of possible sentences in an expression."""
-    if isinstance(expression, Sequence):
-        if expression.type == SequenceType.GROUP:
-            # Counts multiply down the sequence
-            count = 1
-            for sub_item in expression.items:
-                count = count * get_expression_count(
-                    sub_item,
-                    replacements,
-                    exclude_slots=exclude_slots,
-                    count_dict=count_dict,
-                )
+    return _get_expression_count(
+        expression, replacements, exclude_slots=exclude_slots, count_dict=count_dict
+    )
 
-            if count_dict is not None:
-                count_dict[expression] = count
 
-            return count
+def _get_expression_count(
+    expression: Expression,
+    replacements: typing.Optional[ReplacementsType] = None,
+    exclude_slots: bool = True,
+    count_dict: typing.Optional[typing.Dict[Expression, int]] = None,
+    key_counts: typing.Optional[typing.Dict[str, int]] = None,
+) -> int:
+    """Count possible sentences, caching counts of rule/slot replacements by key."""
+    if key_counts is None:
+        key_counts = {}
+
+    # Iterative post-order traversal.
+    # Each stack entry is (expression, number of children) where number of
+    # children is None if the expression has not been expanded yet.
+    stack: typing.List[typing.Tuple[Expression, typing.Optional[int]]] = [
+        (expression, None)
+    ]
+
+    # Counts of completed expressions
+    counts: typing.List[int] = []
+
+    # Replacement keys currently being expanded (guards against cycles)
+    active_keys: typing.Set[str] = set()
+
+    while stack:
+        current, num_children = stack.pop()
+        key: typing.Optional[str] = None
+        if num_children is None:
+            # First visit
+            children: typing.Optional[typing.Sequence[Expression]] = None
+            if isinstance(current, Sequence):
+                if current.type in (SequenceType.GROUP, SequenceType.ALTERNATIVE):
+                    children = current.items
+            elif isinstance(current, RuleReference):
+                # Get substituted sentences for <rule>
+                key = f"<{current.full_rule_name}>"
+                assert replacements, key
+                children = replacements[key]
+            elif (not exclude_slots) and isinstance(current, SlotReference):
+                # Get substituted sentences for $slot
+                key = f"${current.slot_name}"
+                assert replacements, key
+                children = replacements[key]
+            elif isinstance(current, Word):
+                # Single word
+                children = []
+
+            if children is None:
+                # Unknown expression type
+                count = 0
+            elif (key is not None) and (key in key_counts):
+                # Replacements were already counted
+                count = key_counts[key]
+            elif (
+                (key is None)
+                and (count_dict is None)
+                and children
+                and all(isinstance(child, Word) for child in children)
+            ):
+                # Flat group/alternative of plain words.
+                # Each word counts as 1, so the product is 1 and the sum is
+                # the number of words.
+                if isinstance(current, Sequence) and (
+                    current.type == SequenceType.GROUP
+                ):
+                    count = 1
+                else:
+                    count = len(children)
+            elif children:
+                if key is not None:
+                    if key in active_keys:
+                        raise RecursionError(f"Recursive reference to {key}")
 
-        if expression.type == SequenceType.ALTERNATIVE:
-            # Counts sum across the alternatives
-            count = sum(
-                get_expression_count(
-                    sub_item,
-                    replacements,
-                    exclude_slots=exclude_slots,
-                    count_dict=count_dict,
-                )
-                for sub_item in expression.items
-            )
+                    active_keys.add(key)
 
-            if count_dict is not None:
-                count_dict[expression] = count
-
-            return count
-    elif isinstance(expression, RuleReference):
-        # Get substituted sentences for <rule>
-        key = f"<{expression.full_rule_name}>"
-        assert replacements, key
-        count = sum(
-            get_expression_count(
-                value, replacements, exclude_slots=exclude_slots, count_dict=count_dict
-            )
-            for value in replacements[key]
-        )
+                # Visit children first (in order), then combine their counts
+                stack.append((current, len(children)))
+                stack.extend((child, None) for child in reversed(children))
+                continue
+            elif isinstance(current, Word) or (
+                isinstance(current, Sequence) and (current.type == SequenceType.GROUP)
+            ):
+                # Single word or empty group
+                count = 1
+            else:
+                # Empty alternative/replacements
+                count = 0
+        else:
+            # All children have been counted
+            child_counts = counts[-num_children:]
+            del counts[-num_children:]
+
+            if isinstance(current, Sequence) and (current.type == SequenceType.GROUP):
+                # Counts multiply down the sequence
+                count = functools.reduce(operator.mul, child_counts, 1)
+            else:
+                # Counts sum across the alternatives/replacements
+                count = sum(child_counts)
 
-        if count_dict is not None:
-            count_dict[expression] = count
-
-        return count
-    elif (not exclude_slots) and isinstance(expression, SlotReference):
-        # Get substituted sentences for $slot
-        key = f"${expression.slot_name}"
-        assert replacements, key
-        count = sum(
-            get_expression_count(
-                value, replacements, exclude_slots=exclude_slots, count_dict=count_dict
-            )
-            for value in replacements[key]
-        )
+                if isinstance(current, RuleReference):
+                    key = f"<{current.full_rule_name}>"
+                elif isinstance(current, SlotReference):
+                    key = f"${current.slot_name}"
 
-        if count_dict is not None:
-            count_dict[expression] = count
+                if key is not None:
+                    active_keys.discard(key)
+                    key_counts[key] = count
 
-        return count
-    elif isinstance(expression, Word):
-        # Single word
-        count = 1
         if count_dict is not None:
-            count_dict[expression] = count
-
-        return count
+            count_dict[current] = count
 
-    # Unknown expression type
-    count = 0
-    if count_dict is not None:
-        count_dict[expression] = count
+        counts.append(count)
 
-    return count
+    return counts[0]
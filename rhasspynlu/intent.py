@@ -12,7 +12,7 @@ from numbers import Number
 from . import utils
 
 
-@dataclass
+@dataclass(**utils.DATACLASS_SLOTS)
 class Entity:
     """Named entity from intent."""
 
@@ -54,7 +54,7 @@ class Entity:
         return Entity(**utils.only_fields(cls, entity_dict))
 
 
-@dataclass
+@dataclass(**utils.DATACLASS_SLOTS)
 class Intent:
     """Named intention with entities and slots."""
 
@@ -67,7 +67,7 @@ class Intent:
         return Intent(**utils.only_fields(cls, intent_dict))
 
 
-@dataclass
+@dataclass(**utils.DATACLASS_SLOTS)
 class TagInfo:
     """Information used to process FST tags."""
 
@@ -90,7 +90,7 @@ class RecognitionResult(str, Enum):
     FAILURE = "failure"
 
 
-@dataclass
+@dataclass(**utils.DATACLASS_SLOTS)
 class Recognition:
     """Output of intent recognition."""
 
@@ -1,5 +1,6 @@
 """Parses a subset of JSGF into objects."""
 import re
+import sys
 import typing
 from dataclasses import dataclass, field
 from enum import Enum
@@ -123,17 +124,23 @@ class Sentence(Sequence):
     """Sequence representing a complete sentence template."""
 
     @staticmethod
-    def parse(text: str, metadata: typing.Optional[ParseMetadata] = None) -> "Sentence":
-        """Parse a single sentence."""
+    def parse(
+        text: str,
+        metadata: typing.Optional[ParseMetadata] = None,
+        flatten: bool = False,
+    ) -> "Sentence":
+        """Parse a single sentence.
+
+        If flatten is True, plain single-item groups are replaced by their item.
+        """
         s = Sentence(text=text)
         parse_expression(s, text, metadata=metadata)
-        return Sentence(
-            text=s.text,
-            items=s.items,
-            type=s.type,
-            tag=s.tag,
-            substitution=s.substitution,
-        )
+
+        if flatten:
+            flatten_groups(s)
+
+        # Parsed in place; no need to copy into a second Sentence
+        return s
 
 
 @dataclass
@@ -148,7 +155,11 @@ class Rule:
     text: str = ""
 
     @staticmethod
-    def parse(text: str, metadata: typing.Optional[ParseMetadata] = None) -> "Rule":
+    def parse(
+        text: str,
+        metadata: typing.Optional[ParseMetadata] = None,
+        flatten: bool = False,
+    ) -> "Rule":
         """Parse a single rule."""
         # public <RuleName> = rule body;
         # <RuleName> = rule body;
@@ -159,7 +170,7 @@ class Rule:
         rule_name = rule_match.group(2)
         rule_text = rule_match.group(3)
 
-        s = Sentence.parse(rule_text, metadata=metadata)
+        s = Sentence.parse(rule_text, metadata=metadata, flatten=flatten)
         return Rule(rule_name=rule_name, rule_body=s, public=public, text=text)
 
 
@@ -173,53 +184,100 @@ def walk_expression(
     ],
     replacements: typing.Optional[typing.Dict[str, typing.List[Expression]]] = None,
 ) -> typing.Union[bool, typing.Optional[Expression]]:
-    """Recursively visit/replace nodes in expression."""
-    result = visit(expression)
+    """Visit/replace nodes in expression (depth-first, pre-order)."""
+    # Root is held in a list so it can be replaced like any other item
+    root: typing.List[Expression] = [expression]
+
+    # (container, index) of each expression left to visit, where container is
+    # a list of items or a Rule (body). A container of None marks the end of a
+    # replacement key's expressions.
+    stack: typing.List[typing.Tuple[typing.Any, typing.Any]] = [(root, 0)]
+    active_keys: typing.Set[str] = set()
+
+    while stack:
+        container, index = stack.pop()
+        if container is None:
+            # Finished walking replacements for key
+            active_keys.discard(index)
+            continue
 
-    if result is False:
-        return False
+        # Exact list check avoids an isinstance call for the common case
+        is_rule = (
+            type(container) is not list  # pylint: disable=unidiomatic-typecheck
+        ) and isinstance(container, Rule)
+        expression = container.rule_body if is_rule else container[index]
+        result = visit(expression)
 
-    if result is not None:
-        assert isinstance(result, Expression), f"Expected Expression, got {result}"
-        expression = result
+        if result is False:
+            if container is root:
+                return False
 
-    if isinstance(expression, Sequence):
-        for i in range(len(expression.items)):
-            new_item = walk_expression(expression.items[i], visit, replacements)
-            if new_item:
+            # Skip children
+            continue
+
+        if result is not None:
+            assert isinstance(result, Expression), f"Expected Expression, got {result}"
+            expression = result
+
+            if is_rule:
                 assert isinstance(
-                    new_item, Expression
-                ), f"Expected Expression, got {new_item}"
-                expression.items[i] = new_item
-    elif isinstance(expression, Rule):
-        new_body = walk_expression(expression.rule_body, visit, replacements)
-        if new_body:
-            assert isinstance(new_body, Sentence), f"Expected Sentence, got {new_body}"
-            expression.rule_body = new_body
-    elif isinstance(expression, RuleReference):
-        key = f"<{expression.full_rule_name}>"
-        if replacements and (key in replacements):
-            key_replacements = replacements[key]
-            for i in range(len(key_replacements)):
-                new_item = walk_expression(key_replacements[i], visit, replacements)
-                if new_item:
-                    assert isinstance(
-                        new_item, Expression
-                    ), f"Expected Expression, got {new_item}"
-                    key_replacements[i] = new_item
-    elif isinstance(expression, SlotReference):
-        key = f"${expression.slot_name}"
-        if replacements and (key in replacements):
-            key_replacements = replacements[key]
-            for i in range(len(key_replacements)):
-                new_item = walk_expression(key_replacements[i], visit, replacements)
-                if new_item:
-                    assert isinstance(
-                        new_item, Expression
-                    ), f"Expected Expression, got {new_item}"
-                    key_replacements[i] = new_item
-
-    return expression
+                    expression, Sentence
+                ), f"Expected Sentence, got {expression}"
+                container.rule_body = expression
+            else:
+                container[index] = expression
+
+        # Push children in reverse so they're visited in order.
+        # Exact type check first for the most common node.
+        if type(expression) is Word:  # pylint: disable=unidiomatic-typecheck
+            # No children
+            continue
+
+        if isinstance(expression, Sequence):
+            items = expression.items
+            stack.extend((items, i) for i in reversed(range(len(items))))
+        elif isinstance(expression, Rule):
+            stack.append((expression, None))
+        elif replacements and isinstance(expression, (RuleReference, SlotReference)):
+            if isinstance(expression, RuleReference):
+                key = f"<{expression.full_rule_name}>"
+            else:
+                key = f"${expression.slot_name}"
+
+            key_replacements = replacements.get(key)
+            if key_replacements is not None:
+                if key in active_keys:
+                    raise RecursionError(f"Recursive reference to {key}")
+
+                active_keys.add(key)
+                stack.append((None, key))
+                stack.extend(
+                    (key_replacements, i)
+                    for i in reversed(range(len(key_replacements)))
+                )
+
+    return root[0]
+
+
+def flatten_groups(sequence: Sequence):
+    """Replace plain single-item groups by their item (in place)."""
+    stack: typing.List[Sequence] = [sequence]
+    while stack:
+        items = stack.pop().items
+        for i, item in enumerate(items):
+            while (
+                isinstance(item, Sequence)
+                and (item.type == SequenceType.GROUP)
+                and (len(item.items) == 1)
+                and (item.tag is None)
+                and (item.substitution is None)
+                and (not item.converters)
+            ):
+                item = item.items[0]
+
+            items[i] = item
+            if isinstance(item, Sequence):
+                stack.append(item)
 
 
 # -----------------------------------------------------------------------------
@@ -235,19 +293,29 @@ def maybe_remove_parens(s: str) -> str:
 
 def split_words(text: str) -> typing.Iterable[Expression]:
     """Split words by whitespace. Detect slot references and substitutions."""
+    if ":(" not in text:
+        # No substitution sequences, so every space is a break
+        return _words_to_expressions([t for t in text.split(" ") if t])
+
     tokens: typing.List[str] = []
-    token: str = ""
+    token_parts: typing.List[str] = []
+    token_start: int = 0
     last_c: str = ""
     in_seq_sub: bool = False
 
     # Process words, correctly handling substitution sequences.
     # e.g., input:(output words)
-    for c in text:
+    #
+    # Tokens are sliced out of text rather than built up character by
+    # character.
+    for current_index, c in enumerate(text):
         break_token = False
 
         if (c == "(") and (last_c == ":"):
-            # Begin sequence substitution
+            # Begin sequence substitution (parenthesis is dropped)
             in_seq_sub = True
+            token_parts.append(text[token_start:current_index])
+            token_start = current_index + 1
         elif in_seq_sub and (c == ")"):
             # End sequence substitution
             in_seq_sub = False
@@ -255,20 +323,29 @@ def split_words(text: str) -> typing.Iterable[Expression]:
         elif c == " " and (not in_seq_sub):
             # Whitespace break (not inside sequence substitution)
             break_token = True
-        else:
-            # Accumulate into token
-            token += c
 
-        if break_token and token:
-            tokens.append(token)
-            token = ""
+        if break_token:
+            token_parts.append(text[token_start:current_index])
+            token = "".join(token_parts)
+            if token:
+                tokens.append(token)
+
+            token_parts = []
+            token_start = current_index + 1
 
         last_c = c
 
+    # Last token
+    token_parts.append(text[token_start:])
+    token = "".join(token_parts)
     if token:
-        # Last token
         tokens.append(token)
 
+    return _words_to_expressions(tokens)
+
+
+def _words_to_expressions(tokens: typing.List[str]) -> typing.Iterable[Expression]:
+    """Create slot references and words from split tokens."""
     for token in tokens:
         if token[:1] == "$":
             slot_name = token[1:]
@@ -300,9 +377,33 @@ def split_words(text: str) -> typing.Iterable[Expression]:
                 word.text = lhs
                 word.substitution = Substitutable.parse_substitution(rhs)
 
+            # Identical words share one string across all parsed sentences
+            word.text = sys.intern(word.text)
+
             yield word
 
 
+# Characters that may change parser state (besides expression end characters)
+_SPECIAL_CHARS = ":!()<>[]{}|"
+
+# Cache of compiled literal run patterns by end characters
+_LITERAL_RUN_PATTERNS: typing.Dict[typing.Tuple[str, ...], typing.Pattern] = {}
+
+
+def _literal_run_pattern(end: typing.List[str]) -> typing.Pattern:
+    """Get regex that matches a run of plain literal characters."""
+    key = tuple(end)
+    pattern = _LITERAL_RUN_PATTERNS.get(key)
+    if pattern is None:
+        special = set(_SPECIAL_CHARS).union(*end)
+        pattern = re.compile(
+            "[^" + "".join(re.escape(c) for c in sorted(special)) + "]+"
+        )
+        _LITERAL_RUN_PATTERNS[key] = pattern
+
+    return pattern
+
+
 def parse_expression(
     root: typing.Optional[Sequence],
     text: str,
@@ -314,15 +415,25 @@ def parse_expression(
     end = end or []
     found: bool = False
     next_index: int = 0
-    literal: str = ""
+    literal_parts: typing.List[str] = []
     last_taggable: typing.Optional[Taggable] = None
     last_group: typing.Optional[Sequence] = root
+    literal_run = _literal_run_pattern(end)
 
-    # Process text character-by-character
-    for current_index, c in enumerate(text):
+    # Process text, consuming runs of plain literal characters at once
+    current_index = 0
+    while current_index < len(text):
         if current_index < next_index:
-            # Skip ahread
-            current_index += 1
+            # Skip ahead
+            current_index = next_index
+            continue
+
+        c = text[current_index]
+        match = literal_run.match(text, current_index)
+        if match is not None:
+            # Accumulate run into current literal
+            literal_parts.append(match.group())
+            next_index = match.end()
             continue
 
         # Get previous character
@@ -406,7 +517,8 @@ def parse_expression(
             # Begin group/tag/alt/etc.
 
             # Break literal here
-            literal = literal.strip()
+            literal = "".join(literal_parts).strip()
+            literal_parts = []
             if literal:
                 assert last_group is not None, parse_error(
                     "No group preceeding literal",
@@ -425,7 +537,6 @@ def parse_expression(
                     metadata=metadata,
                 )
                 last_taggable = last_word
-                literal = ""
 
             if c == "<":
                 # Rule reference
@@ -618,13 +729,16 @@ def parse_expression(
                 alternative.items.append(last_group)
         else:
             # Accumulate into current literal
-            literal += c
+            literal_parts.append(c)
+
+        # Always make progress
+        next_index = max(next_index, current_index + 1)
 
     # End of expression
     current_index = len(text)
 
     # Break literal
-    literal = literal.strip()
+    literal = "".join(literal_parts).strip()
     if is_literal and literal:
         assert root is not None, parse_error(
             "Literal outside parent expression", text, current_index, metadata=metadata
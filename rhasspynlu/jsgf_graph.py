@@ -1,9 +1,11 @@
 """Utilities to convert JSGF sentences to directed graphs."""
 import base64
 import gzip
-import io
 import math
+import pickle
+import sys
 import typing
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -23,6 +25,7 @@ from .jsgf import (
     Word,
 )
 from .slots import split_slot_args
+from .utils import DATACLASS_SLOTS
 
 # -----------------------------------------------------------------------------
 
@@ -324,9 +327,10 @@ def add_substitution(
 def maybe_pack(olabel: str) -> str:
     """Pack output label as base64 if it contains whitespace."""
     if " " in olabel:
-        return "__unpack__" + base64.encodebytes(olabel.encode()).decode().strip()
+        olabel = "__unpack__" + base64.encodebytes(olabel.encode()).decode().strip()
 
-    return olabel
+    # Generated labels (__begin__, __convert__, etc.) repeat across the graph
+    return sys.intern(olabel)
 
 
 # -----------------------------------------------------------------------------
@@ -360,6 +364,9 @@ def sentences_to_graph(
     intent_weights: typing.Dict[str, float] = {}
     count_dict: typing.Optional[typing.Dict[Expression, int]] = None
 
+    # Weights are only added to the graph when there is more than one intent
+    add_intent_weights = add_intent_weights and (num_intents > 1)
+
     if add_intent_weights:
         # Count number of posssible sentences per intent
         intent_counts = get_intent_counts(
@@ -401,7 +408,7 @@ def sentences_to_graph(
         label = f":{olabel}"
 
         edge_kwargs: typing.Dict[str, typing.Any] = {}
-        if add_intent_weights and (num_intents > 1):
+        if add_intent_weights:
             edge_kwargs["sentence_count"] = intent_counts.get(intent_name, 1)
             edge_kwargs["weight"] = intent_weights.get(intent_name, 0)
 
@@ -453,19 +460,37 @@ def json_to_graph(json_dict: typing.Dict[str, typing.Any]) -> nx.DiGraph:
 def graph_to_gzip_pickle(graph: nx.DiGraph, out_file: typing.BinaryIO, filename=None):
     """Convert to binary gzip pickle format."""
     with gzip.GzipFile(fileobj=out_file, filename=filename, mode="wb") as graph_gzip:
-        nx.readwrite.gpickle.write_gpickle(graph, graph_gzip)
+        pickle.dump(graph, graph_gzip, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def gzip_pickle_to_graph(in_file: typing.BinaryIO) -> nx.DiGraph:
     """Convert from binary gzip pickle format."""
     with gzip.GzipFile(fileobj=in_file, mode="rb") as graph_gzip:
-        return nx.readwrite.gpickle.read_gpickle(graph_gzip)
+        return pickle.load(graph_gzip)
 
 
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+def _edge_bfs(
+    graph: nx.DiGraph, source: int
+) -> typing.Iterable[typing.Tuple[int, int, typing.Dict[str, typing.Any]]]:
+    """Yield (from_node, to_node, edge_data) in the same order as nx.edge_bfs."""
+    adj = graph.adj
+    visited: typing.Set[int] = {source}
+    node_queue: typing.Deque[int] = deque([source])
+
+    while node_queue:
+        from_node = node_queue.popleft()
+        for to_node, edge_data in adj[from_node].items():
+            if to_node not in visited:
+                visited.add(to_node)
+                node_queue.append(to_node)
+
+            yield from_node, to_node, edge_data
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GraphFsts:
     """Result from graph_to_fsts."""
 
@@ -492,7 +517,10 @@ def graph_to_fsts(
     # start state
     start_node: int = next(n for n, data in n_data if data.get("start"))
 
-    for _, intent_node, edge_data in graph.edges(start_node, data=True):
+    # Look up final nodes once instead of per edge
+    final_nodes: typing.Set[int] = {n for n, data in n_data if data.get("final")}
+
+    for intent_node, edge_data in graph.adj[start_node].items():
         intent_name: str = edge_data["olabel"][9:]
 
         # Filter intents by name
@@ -502,57 +530,49 @@ def graph_to_fsts(
         final_states: typing.Set[int] = set()
         state_map: typing.Dict[int, int] = {}
 
-        with io.StringIO() as intent_file:
-            # Transitions
-            for edge in nx.edge_bfs(graph, intent_node):
-                edge_data = graph.edges[edge]
-                from_node, to_node = edge
-
-                # Map states starting from 0
-                from_state = state_map.get(from_node, len(state_map))
-                state_map[from_node] = from_state
-
-                to_state = state_map.get(to_node, len(state_map))
-                state_map[to_node] = to_state
-
-                # Get input/output labels.
-                # Empty string indicates epsilon transition (eps)
-                ilabel = edge_data.get("ilabel", "") or eps
-                olabel = edge_data.get("olabel", "") or eps
-
-                # Map labels (symbols) to integers
-                isymbol = symbols.get(ilabel, len(symbols))
-                symbols[ilabel] = isymbol
-                input_symbols[ilabel] = isymbol
-
-                osymbol = symbols.get(olabel, len(symbols))
-                symbols[olabel] = osymbol
-                output_symbols[olabel] = osymbol
-
-                if weight_key:
-                    weight = edge_data.get(weight_key, default_weight)
-                    print(
-                        f"{from_state} {to_state} {ilabel} {olabel} {weight}",
-                        file=intent_file,
-                    )
-                else:
-                    # No weight
-                    print(
-                        f"{from_state} {to_state} {ilabel} {olabel}", file=intent_file
-                    )
-
-                # Check if final state
-                if n_data[from_node].get("final", False):
-                    final_states.add(from_state)
-
-                if n_data[to_node].get("final", False):
-                    final_states.add(to_state)
-
-            # Record final states
-            for final_state in final_states:
-                print(final_state, file=intent_file)
+        # Lines of FST text (joined once at the end)
+        intent_lines: typing.List[str] = []
+
+        # Transitions
+        for from_node, to_node, edge_data in _edge_bfs(graph, intent_node):
+
+            # Map states starting from 0
+            from_state = state_map.setdefault(from_node, len(state_map))
+            to_state = state_map.setdefault(to_node, len(state_map))
+
+            # Get input/output labels.
+            # Empty string indicates epsilon transition (eps)
+            ilabel = edge_data.get("ilabel", "") or eps
+            olabel = edge_data.get("olabel", "") or eps
+
+            # Map labels (symbols) to integers
+            isymbol = symbols.setdefault(ilabel, len(symbols))
+            input_symbols[ilabel] = isymbol
 
-            intent_fsts[intent_name] = intent_file.getvalue()
+            osymbol = symbols.setdefault(olabel, len(symbols))
+            output_symbols[olabel] = osymbol
+
+            if weight_key:
+                weight = edge_data.get(weight_key, default_weight)
+                intent_lines.append(
+                    f"{from_state} {to_state} {ilabel} {olabel} {weight}\n"
+                )
+            else:
+                # No weight
+                intent_lines.append(f"{from_state} {to_state} {ilabel} {olabel}\n")
+
+            # Check if final state
+            if from_node in final_nodes:
+                final_states.add(from_state)
+
+            if to_node in final_nodes:
+                final_states.add(to_state)
+
+        # Record final states
+        for final_state in final_states:
+            intent_lines.append(f"{final_state}\n")
+
+        intent_fsts[intent_name] = "".join(intent_lines)
 
     return GraphFsts(
         intent_fsts=intent_fsts,
@@ -565,7 +585,7 @@ def graph_to_fsts(
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GraphFst:
     """Result from graph_to_fst."""
 
@@ -613,112 +633,102 @@ def graph_to_fst(
     # start state
     start_node: int = next(n for n, data in n_data if data.get("start"))
 
-    # Generate FST text
-    with io.StringIO() as fst_file:
-        final_states: typing.Set[int] = set()
-        state_map: typing.Dict[int, int] = {}
+    # Look up final nodes once instead of per edge
+    final_nodes: typing.Set[int] = {n for n, data in n_data if data.get("final")}
 
-        # Transitions
-        for _, intent_node, intent_edge_data in graph.edges(start_node, data=True):
-            intent_olabel: str = intent_edge_data["olabel"]
-            intent_name: str = intent_olabel[9:]
+    # Lines of FST text (joined once at the end)
+    fst_lines: typing.List[str] = []
+
+    final_states: typing.Set[int] = set()
+    state_map: typing.Dict[int, int] = {}
+
+    # Transitions
+    for intent_node, intent_edge_data in graph.adj[start_node].items():
+        intent_olabel: str = intent_edge_data["olabel"]
+        intent_name: str = intent_olabel[9:]
+
+        # Filter intents by name
+        if intent_filter and not intent_filter(intent_name):
+            continue
+
+        assert (
+            " " not in intent_olabel
+        ), f"Output symbol cannot contain whitespace: {intent_olabel}"
+
+        # Map states starting from 0
+        from_state = state_map.setdefault(start_node, len(state_map))
+        to_state = state_map.setdefault(intent_node, len(state_map))
+
+        # Map labels (symbols) to integers
+        isymbol = symbols.setdefault(eps, len(symbols))
+        input_symbols[eps] = isymbol
+
+        osymbol = symbols.setdefault(intent_olabel, len(symbols))
+        output_symbols[intent_olabel] = osymbol
+
+        if weight_key:
+            weight = intent_edge_data.get(weight_key, default_weight)
+            fst_lines.append(
+                f"{from_state} {to_state} {eps} {intent_olabel} {weight}\n"
+            )
+        else:
+            # No weight
+            fst_lines.append(f"{from_state} {to_state} {eps} {intent_olabel}\n")
 
-            # Filter intents by name
-            if intent_filter and not intent_filter(intent_name):
-                continue
+        # Add intent sub-graphs
+        for from_node, to_node, edge_data in _edge_bfs(graph, intent_node):
 
+            # Get input/output labels.
+            # Empty string indicates epsilon transition (eps)
+            ilabel = edge_data.get("ilabel", "") or eps
+            olabel = edge_data.get("olabel", "") or eps
+
+            # Check for whitespace
             assert (
-                " " not in intent_olabel
-            ), f"Output symbol cannot contain whitespace: {intent_olabel}"
+                " " not in ilabel
+            ), f"Input symbol cannot contain whitespace: {ilabel}"
 
-            # Map states starting from 0
-            from_state = state_map.get(start_node, len(state_map))
-            state_map[start_node] = from_state
+            assert (
+                " " not in olabel
+            ), f"Output symbol cannot contain whitespace: {olabel}"
 
-            to_state = state_map.get(intent_node, len(state_map))
-            state_map[intent_node] = to_state
+            # Map states starting from 0
+            from_state = state_map.setdefault(from_node, len(state_map))
+            to_state = state_map.setdefault(to_node, len(state_map))
 
             # Map labels (symbols) to integers
-            isymbol = symbols.get(eps, len(symbols))
-            symbols[eps] = isymbol
-            input_symbols[eps] = isymbol
+            isymbol = symbols.setdefault(ilabel, len(symbols))
+            input_symbols[ilabel] = isymbol
 
-            osymbol = symbols.get(intent_olabel, len(symbols))
-            symbols[intent_olabel] = osymbol
-            output_symbols[intent_olabel] = osymbol
+            osymbol = symbols.setdefault(olabel, len(symbols))
+            output_symbols[olabel] = osymbol
 
             if weight_key:
-                weight = intent_edge_data.get(weight_key, default_weight)
-                print(
-                    f"{from_state} {to_state} {eps} {intent_olabel} {weight}",
-                    file=fst_file,
+                weight = edge_data.get(weight_key, default_weight)
+                fst_lines.append(
+                    f"{from_state} {to_state} {ilabel} {olabel} {weight}\n"
                 )
             else:
                 # No weight
-                print(f"{from_state} {to_state} {eps} {intent_olabel}", file=fst_file)
-
-            # Add intent sub-graphs
-            for edge in nx.edge_bfs(graph, intent_node):
-                edge_data = graph.edges[edge]
-                from_node, to_node = edge
-
-                # Get input/output labels.
-                # Empty string indicates epsilon transition (eps)
-                ilabel = edge_data.get("ilabel", "") or eps
-                olabel = edge_data.get("olabel", "") or eps
-
-                # Check for whitespace
-                assert (
-                    " " not in ilabel
-                ), f"Input symbol cannot contain whitespace: {ilabel}"
-
-                assert (
-                    " " not in olabel
-                ), f"Output symbol cannot contain whitespace: {olabel}"
-
-                # Map states starting from 0
-                from_state = state_map.get(from_node, len(state_map))
-                state_map[from_node] = from_state
-
-                to_state = state_map.get(to_node, len(state_map))
-                state_map[to_node] = to_state
-
-                # Map labels (symbols) to integers
-                isymbol = symbols.get(ilabel, len(symbols))
-                symbols[ilabel] = isymbol
-                input_symbols[ilabel] = isymbol
-
-                osymbol = symbols.get(olabel, len(symbols))
-                symbols[olabel] = osymbol
-                output_symbols[olabel] = osymbol
-
-                if weight_key:
-                    weight = edge_data.get(weight_key, default_weight)
-                    print(
-                        f"{from_state} {to_state} {ilabel} {olabel} {weight}",
-                        file=fst_file,
-                    )
-                else:
-                    # No weight
-                    print(f"{from_state} {to_state} {ilabel} {olabel}", file=fst_file)
-
-                # Check if final state
-                if n_data[from_node].get("final", False):
-                    final_states.add(from_state)
-
-                if n_data[to_node].get("final", False):
-                    final_states.add(to_state)
+                fst_lines.append(f"{from_state} {to_state} {ilabel} {olabel}\n")
 
-        # Record final states
-        for final_state in final_states:
-            print(final_state, file=fst_file)
+            # Check if final state
+            if from_node in final_nodes:
+                final_states.add(from_state)
 
-        return GraphFst(
-            intent_fst=fst_file.getvalue(),
-            symbols=symbols,
-            input_symbols=input_symbols,
-            output_symbols=output_symbols,
-        )
+            if to_node in final_nodes:
+                final_states.add(to_state)
+
+    # Record final states
+    for final_state in final_states:
+        fst_lines.append(f"{final_state}\n")
+
+    return GraphFst(
+        intent_fst="".join(fst_lines),
+        symbols=symbols,
+        input_symbols=input_symbols,
+        output_symbols=output_symbols,
+    )
 
 
 # -----------------------------------------------------------------------------
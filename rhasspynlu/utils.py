@@ -1,8 +1,14 @@
 """Utility methods for rhasspynlu"""
 import dataclasses
 import itertools
+import sys
 import typing
 
+# Keyword arguments to use __slots__ in dataclasses where supported (Python 3.10+)
+DATACLASS_SLOTS: typing.Dict[str, typing.Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 def pairwise(iterable: typing.Iterable[typing.Any]):
     """s -> (s0,s1), (s1,s2), (s2,s3), ..."""
@@ -0,0 +1,11 @@
+"""Shared helpers for test cases."""
+import functools
+
+from rhasspynlu.ini_jsgf import parse_ini
+from rhasspynlu.jsgf_graph import intents_to_graph
+
+
+@functools.lru_cache(maxsize=None)
+def get_graph(ini_text):
+    """Parse ini text and build its intent graph (cached by text)."""
+    return intents_to_graph(parse_ini(ini_text))
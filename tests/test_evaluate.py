@@ -89,6 +89,59 @@ class IntentEvaluationTests(unittest.TestCase):
         self.assertEqual(1, report.correct_entities)
         self.assertEqual(1, report.correct_intent_and_entities)
 
+    def test_evaluate_entities(self):
+        """Test intent evaluation with wrong and missing entities."""
+        expected = {
+            "test1": Recognition(
+                intent=Intent(name="TestIntent"),
+                entities=[
+                    Entity(entity="a", value="1"),
+                    Entity(entity="b", value="2"),
+                    Entity(entity="a", value="1"),
+                ],
+                text="this is a test",
+            )
+        }
+
+        actual = {
+            "test1": Recognition(
+                intent=Intent(name="TestIntent"),
+                entities=[Entity(entity="a", value="1"), Entity(entity="c", value="3")],
+                text="this is a test",
+            )
+        }
+
+        report = evaluate_intents(expected, actual)
+
+        self.assertEqual(3, report.num_entities)
+        self.assertEqual(1, report.correct_entities)
+        self.assertEqual(0, report.correct_intent_and_entities)
+        self.assertEqual([("c", "3")], report.actual["test1"].wrong_entities)
+        self.assertEqual(
+            [("b", "2"), ("a", "1")], report.actual["test1"].missing_entities
+        )
+
+    def test_evaluate_workers(self):
+        """Test intent evaluation with a process pool."""
+        expected = {
+            f"test{i}": Recognition(
+                intent=Intent(name="TestIntent"), text=f"this is test number {i}"
+            )
+            for i in range(10)
+        }
+
+        actual = {
+            f"test{i}": Recognition(
+                intent=Intent(name="TestIntent"), text=f"this is a test {i}"
+            )
+            for i in range(10)
+        }
+
+        report = evaluate_intents(expected, actual)
+        parallel_report = evaluate_intents(expected, actual, workers=2)
+
+        self.assertEqual(report, parallel_report)
+
 
 # -----------------------------------------------------------------------------
 
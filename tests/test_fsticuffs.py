@@ -1,141 +1,147 @@
 """Test cases for recognition functions."""
+import functools
 import unittest
 from pathlib import Path
 
 from rhasspynlu.fsticuffs import recognize
 from rhasspynlu.ini_jsgf import parse_ini
 from rhasspynlu.intent import Entity, Intent, Recognition
-from rhasspynlu.jsgf import Sentence
+from rhasspynlu.jsgf import Sentence, SequenceType, Word
 from rhasspynlu.jsgf_graph import intents_to_graph
 
+from . import get_graph
 
-class StrictTestCase(unittest.TestCase):
-    """Strict recognition test cases."""
+# Recognition without timing, so results can be compared directly
+recognize_fuzzy = functools.partial(recognize, record_times=False)
+recognize_strict = functools.partial(recognize, fuzzy=False, record_times=False)
 
-    def test_single_sentence(self):
-        """Single intent, single sentence."""
-        intents = parse_ini(
-            """
-        [TestIntent]
-        this is a test
-        """
-        )
 
-        graph = intents_to_graph(intents)
+def pow_converter(*args, converter_args=None):
+    """Raise each value to the power given as a converter argument"""
+    exponent = int(converter_args[0]) if converter_args else 1
+    return [x ** exponent for x in args]
 
-        # Exact
-        recognitions = zero_times(recognize("this is a test", graph, fuzzy=False))
-        print(recognitions)
-        self.assertEqual(
-            recognitions,
-            [
-                Recognition(
-                    intent=Intent(name="TestIntent", confidence=1.0),
-                    text="this is a test",
-                    raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
-                )
-            ],
-        )
 
-        # Too many tokens (lower confidence)
-        recognitions = zero_times(recognize("this is a bad test", graph, fuzzy=False))
-        self.assertFalse(recognitions)
+# Extra converters used in tests
+SQUARE_CONVERTERS = {"square": lambda *args: [x * x for x in args]}
+POW_CONVERTERS = {"pow": pow_converter}
+FLOATIFY_CONVERTERS = {"floatify": lambda a, b: [float(f"{a}.{b}")]}
 
-        # Too few tokens (failure)
-        recognitions = zero_times(recognize("this is a", graph, fuzzy=False))
-        self.assertFalse(recognitions)
+# Words that can be dropped from "this is a abcd test"
+STOP_WORDS = frozenset({"abcd"})
 
-    def test_multiple_sentences(self):
-        """Identical sentences from two different intents."""
-        intents = parse_ini(
-            """
-        [TestIntent1]
-        this is a test
+# Tokens of "this is a test" (shared; do not modify)
+TEST_TOKENS = ["this", "is", "a", "test"]
 
-        [TestIntent2]
-        this is a test
-        """
-        )
 
-        graph = intents_to_graph(intents)
+def make_test_sentence():
+    """Create parsed "this is a test" sentence without going through parse_ini"""
+    return Sentence(
+        text="this is a test",
+        items=[Word(text=token) for token in TEST_TOKENS],
+        type=SequenceType.GROUP,
+    )
+
+
+# Single intent, single sentence
+SIMPLE_INTENTS = {"TestIntent": [make_test_sentence()]}
+
+# Identical sentences from two different intents
+MULTI_INTENTS = {
+    "TestIntent1": [make_test_sentence()],
+    "TestIntent2": [make_test_sentence()],
+}
+
+# Graphs shared by the strict and fuzzy test cases (recognize does not modify them)
+SIMPLE_GRAPH = intents_to_graph(SIMPLE_INTENTS)
+MULTI_GRAPH = intents_to_graph(MULTI_INTENTS)
+
+# Expected results for "this is a test"
+EXPECTED_TEST = Recognition(
+    intent=Intent(name="TestIntent", confidence=1.0),
+    text="this is a test",
+    raw_text="this is a test",
+    tokens=TEST_TOKENS,
+    raw_tokens=TEST_TOKENS,
+)
+
+EXPECTED_TEST1 = Recognition(
+    intent=Intent(name="TestIntent1", confidence=1.0),
+    text="this is a test",
+    raw_text="this is a test",
+    tokens=TEST_TOKENS,
+    raw_tokens=TEST_TOKENS,
+)
+
+EXPECTED_TEST2 = Recognition(
+    intent=Intent(name="TestIntent2", confidence=1.0),
+    text="this is a test",
+    raw_text="this is a test",
+    tokens=TEST_TOKENS,
+    raw_tokens=TEST_TOKENS,
+)
+
+
+class StrictTestCase(unittest.TestCase):
+    """Strict recognition test cases."""
+
+    simple_graph = SIMPLE_GRAPH
+    multi_graph = MULTI_GRAPH
+
+    def test_single_sentence(self):
+        """Single intent, single sentence."""
+        graph = self.simple_graph
+
+        cases = [
+            # Exact
+            ("this is a test", [EXPECTED_TEST]),
+            # Too many tokens (failure)
+            ("this is a bad test", []),
+            # Too few tokens (failure)
+            ("this is a", []),
+        ]
+
+        for text, expected in cases:
+            with self.subTest(text=text):
+                recognitions = recognize_strict(text, graph)
+                self.assertEqual(recognitions, expected)
+
+    def test_multiple_sentences(self):
+        """Identical sentences from two different intents."""
+        graph = self.multi_graph
 
         # Should produce a recognition for each intent
-        recognitions = zero_times(recognize("this is a test", graph, fuzzy=False))
-        self.assertEqual(len(recognitions), 2)
-        self.assertIn(
-            Recognition(
-                intent=Intent(name="TestIntent1", confidence=1.0),
-                text="this is a test",
-                raw_text="this is a test",
-                tokens=["this", "is", "a", "test"],
-                raw_tokens=["this", "is", "a", "test"],
-            ),
-            recognitions,
-        )
-        self.assertIn(
-            Recognition(
-                intent=Intent(name="TestIntent2", confidence=1.0),
-                text="this is a test",
-                raw_text="this is a test",
-                tokens=["this", "is", "a", "test"],
-                raw_tokens=["this", "is", "a", "test"],
-            ),
-            recognitions,
+        recognitions = recognize_strict("this is a test", graph)
+        self.assertEqual(
+            sorted(recognitions, key=intent_name), [EXPECTED_TEST1, EXPECTED_TEST2]
         )
 
     def test_stop_words(self):
         """Check sentence with stop words."""
-        intents = parse_ini(
-            """
-        [TestIntent]
-        this is a test
-        """
-        )
-
-        graph = intents_to_graph(intents)
+        graph = self.simple_graph
 
         # Failure without stop words
-        recognitions = zero_times(recognize("this is a abcd test", graph, fuzzy=False))
+        recognitions = recognize_strict("this is a abcd test", graph)
         self.assertFalse(recognitions)
 
         # Success with stop words
-        recognitions = zero_times(
-            recognize("this is a abcd test", graph, stop_words={"abcd"}, fuzzy=False)
-        )
-        self.assertEqual(
-            recognitions,
-            [
-                Recognition(
-                    intent=Intent(name="TestIntent", confidence=1.0),
-                    text="this is a test",
-                    raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
-                )
-            ],
+        recognitions = recognize_strict(
+            "this is a abcd test", graph, stop_words=STOP_WORDS
         )
+        self.assertEqual(recognitions, [EXPECTED_TEST])
 
     def test_converters(self):
         """Check sentence with converters."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is a test!upper ten:10!int!square
         """
         )
 
-        graph = intents_to_graph(intents)
-
         # Should upper-case "test" and convert "ten" -> 10 -> 100
-        recognitions = zero_times(
-            recognize(
-                "this is a test ten",
-                graph,
-                fuzzy=False,
-                extra_converters={"square": lambda *args: [x ** 2 for x in args]},
-            )
+        recognitions = recognize_strict(
+            "this is a test ten", graph, extra_converters=SQUARE_CONVERTERS
         )
         self.assertEqual(
             recognitions,
@@ -152,27 +158,16 @@ class StrictTestCase(unittest.TestCase):
 
     def test_converter_args(self):
         """Check converter with arguments."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is a test ten:10!int!pow,3
         """
         )
 
-        graph = intents_to_graph(intents)
-
-        def pow_converter(*args, converter_args=None):
-            exponent = int(converter_args[0]) if converter_args else 1
-            return [x ** exponent for x in args]
-
         # Should convert "ten" -> 10 -> 1000
-        recognitions = zero_times(
-            recognize(
-                "this is a test ten",
-                graph,
-                fuzzy=False,
-                extra_converters={"pow": pow_converter},
-            )
+        recognitions = recognize_strict(
+            "this is a test ten", graph, extra_converters=POW_CONVERTERS
         )
         self.assertEqual(
             recognitions,
@@ -189,16 +184,14 @@ class StrictTestCase(unittest.TestCase):
 
     def test_drop_group(self):
         """Test dropping a group."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is (a | another): test
         """
         )
 
-        graph = intents_to_graph(intents)
-
-        recognitions = zero_times(recognize("this is a test", graph, fuzzy=False))
+        recognitions = recognize_strict("this is a test", graph)
 
         self.assertEqual(
             recognitions,
@@ -208,7 +201,7 @@ class StrictTestCase(unittest.TestCase):
                     text="this is test",
                     raw_text="this is a test",
                     tokens=["this", "is", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
+                    raw_tokens=TEST_TOKENS,
                 )
             ],
         )
@@ -220,142 +213,73 @@ class StrictTestCase(unittest.TestCase):
 class FuzzyTestCase(unittest.TestCase):
     """Fuzzy recognition test cases."""
 
+    simple_graph = SIMPLE_GRAPH
+    multi_graph = MULTI_GRAPH
+
     def test_single_sentence(self):
         """Single intent, single sentence."""
-        intents = parse_ini(
-            """
-        [TestIntent]
-        this is a test
-        """
-        )
-
-        graph = intents_to_graph(intents)
-
-        # Exact
-        recognitions = zero_times(recognize("this is a test", graph))
-        self.assertEqual(
-            recognitions,
-            [
-                Recognition(
-                    intent=Intent(name="TestIntent", confidence=1.0),
-                    text="this is a test",
-                    raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
-                )
-            ],
-        )
-
-        # Too many tokens (lower confidence)
-        recognitions = zero_times(recognize("this is a bad test", graph))
-        self.assertEqual(
-            recognitions,
-            [
-                Recognition(
-                    intent=Intent(name="TestIntent", confidence=float(1 - 1 / 4)),
-                    text="this is a test",
-                    raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
-                )
-            ],
-        )
+        graph = self.simple_graph
+
+        cases = [
+            # Exact
+            ("this is a test", [EXPECTED_TEST]),
+            # Too many tokens (lower confidence)
+            (
+                "this is a bad test",
+                [
+                    Recognition(
+                        intent=Intent(name="TestIntent", confidence=float(1 - 1 / 4)),
+                        text="this is a test",
+                        raw_text="this is a test",
+                        tokens=TEST_TOKENS,
+                        raw_tokens=TEST_TOKENS,
+                    )
+                ],
+            ),
+            # Too few tokens (failure)
+            ("this is a", []),
+        ]
 
-        # Too few tokens (failure)
-        recognitions = zero_times(recognize("this is a", graph))
-        self.assertFalse(recognitions)
+        for text, expected in cases:
+            with self.subTest(text=text):
+                recognitions = recognize_fuzzy(text, graph)
+                self.assertEqual(recognitions, expected)
 
     def test_multiple_sentences(self):
         """Identical sentences from two different intents."""
-        intents = parse_ini(
-            """
-        [TestIntent1]
-        this is a test
-
-        [TestIntent2]
-        this is a test
-        """
-        )
-
-        graph = intents_to_graph(intents)
+        graph = self.multi_graph
 
         # Should produce a recognition for each intent
-        recognitions = zero_times(recognize("this is a test", graph))
-        self.assertEqual(len(recognitions), 2)
-        self.assertIn(
-            Recognition(
-                intent=Intent(name="TestIntent1", confidence=1.0),
-                text="this is a test",
-                raw_text="this is a test",
-                tokens=["this", "is", "a", "test"],
-                raw_tokens=["this", "is", "a", "test"],
-            ),
-            recognitions,
-        )
-        self.assertIn(
-            Recognition(
-                intent=Intent(name="TestIntent2", confidence=1.0),
-                text="this is a test",
-                raw_text="this is a test",
-                tokens=["this", "is", "a", "test"],
-                raw_tokens=["this", "is", "a", "test"],
-            ),
-            recognitions,
+        recognitions = recognize_fuzzy("this is a test", graph)
+        self.assertEqual(
+            sorted(recognitions, key=intent_name), [EXPECTED_TEST1, EXPECTED_TEST2]
         )
 
     def test_intent_filter(self):
         """Identical sentences from two different intents with filter."""
-        intents = parse_ini(
-            """
-        [TestIntent1]
-        this is a test
-
-        [TestIntent2]
-        this is a test
-        """
-        )
-
-        graph = intents_to_graph(intents)
+        graph = self.multi_graph
 
         def intent_filter(name):
             return name == "TestIntent1"
 
         # Should produce a recognition for first intent only
-        recognitions = zero_times(
-            recognize("this is a test", graph, intent_filter=intent_filter)
-        )
-        self.assertEqual(
-            recognitions,
-            [
-                Recognition(
-                    intent=Intent(name="TestIntent1", confidence=1.0),
-                    text="this is a test",
-                    raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
-                )
-            ],
+        recognitions = recognize_fuzzy(
+            "this is a test", graph, intent_filter=intent_filter
         )
+        self.assertEqual(recognitions, [EXPECTED_TEST1])
 
     def test_stop_words(self):
         """Check sentence with stop words."""
-        intents = parse_ini(
-            """
-        [TestIntent]
-        this is a test
-        """
-        )
-
-        graph = intents_to_graph(intents)
+        graph = self.simple_graph
 
         # Lower confidence with no stop words
-        recognitions = zero_times(recognize("this is a abcd test", graph))
+        recognitions = recognize_fuzzy("this is a abcd test", graph)
         self.assertEqual(len(recognitions), 1)
         self.assertEqual(recognitions[0].intent.confidence, 1 - (1 / 4))
 
         # Higher confidence with stop words
-        recognitions = zero_times(
-            recognize("this is a abcd test", graph, stop_words={"abcd"})
+        recognitions = recognize_fuzzy(
+            "this is a abcd test", graph, stop_words=STOP_WORDS
         )
         self.assertEqual(
             recognitions,
@@ -364,15 +288,15 @@ class FuzzyTestCase(unittest.TestCase):
                     intent=Intent(name="TestIntent", confidence=float(1 - (0.1 / 4))),
                     text="this is a test",
                     raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
+                    tokens=TEST_TOKENS,
+                    raw_tokens=TEST_TOKENS,
                 )
             ],
         )
 
     def test_rules(self):
         """Make sure local and remote rules work."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [Intent1]
         rule = a test
@@ -384,10 +308,8 @@ class FuzzyTestCase(unittest.TestCase):
         """
         )
 
-        graph = intents_to_graph(intents)
-
         # Lower confidence with no stop words
-        recognitions = zero_times(recognize("this is a test", graph))
+        recognitions = recognize_fuzzy("this is a test", graph)
         self.assertEqual(
             recognitions,
             [
@@ -395,15 +317,15 @@ class FuzzyTestCase(unittest.TestCase):
                     intent=Intent(name="Intent1", confidence=1.0),
                     text="this is a test",
                     raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
+                    tokens=TEST_TOKENS,
+                    raw_tokens=TEST_TOKENS,
                 ),
                 Recognition(
                     intent=Intent(name="Intent2", confidence=1.0),
                     text="this is a test",
                     raw_text="this is a test",
-                    tokens=["this", "is", "a", "test"],
-                    raw_tokens=["this", "is", "a", "test"],
+                    tokens=TEST_TOKENS,
+                    raw_tokens=TEST_TOKENS,
                 ),
             ],
         )
@@ -415,15 +337,14 @@ class FuzzyTestCase(unittest.TestCase):
 class TimerTestCase(unittest.TestCase):
     """Test cases for timer example."""
 
-    def setUp(self):
-        # Load timer example
-        self.graph = intents_to_graph(parse_ini(Path("etc/timer.ini")))
+    @classmethod
+    def setUpClass(cls):
+        # Load timer example (once for all tests)
+        cls.graph = intents_to_graph(parse_ini(Path("etc/timer.ini")))
 
     def test_strict_simple(self):
         """Check exact parse."""
-        recognitions = zero_times(
-            recognize("set a timer for ten minutes", self.graph, fuzzy=False)
-        )
+        recognitions = recognize_strict("set a timer for ten minutes", self.graph)
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
         self.assertTrue(recognition.intent)
@@ -445,6 +366,23 @@ class TimerTestCase(unittest.TestCase):
             ],
         )
 
+    def test_record_times(self):
+        """Check that recognition time is recorded unless disabled."""
+        text = "set a timer for ten minutes"
+        for fuzzy in [True, False]:
+            with self.subTest(fuzzy=fuzzy):
+                recognitions = recognize(text, self.graph, fuzzy=fuzzy)
+                self.assertEqual(len(recognitions), 1)
+                # Coarse timers may report zero elapsed time
+                self.assertIsNotNone(recognitions[0].recognize_seconds)
+                self.assertGreaterEqual(recognitions[0].recognize_seconds, 0)
+
+                recognitions = recognize(
+                    text, self.graph, fuzzy=fuzzy, record_times=False
+                )
+                self.assertEqual(len(recognitions), 1)
+                self.assertEqual(recognitions[0].recognize_seconds, 0)
+
 
 # -----------------------------------------------------------------------------
 
@@ -466,117 +404,94 @@ class MiscellaneousTestCase(unittest.TestCase):
 
         graph = intents_to_graph(parse_ini(ini_text), replacements)
 
-        recognitions = zero_times(
-            recognize(
-                "read me the hound of the baskervilles in the bedroom",
-                graph,
-                fuzzy=False,
-            )
+        recognitions = recognize_strict(
+            "read me the hound of the baskervilles in the bedroom", graph
         )
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
         self.assertTrue(recognition.intent)
 
-        entities = {e.entity: e for e in recognition.entities}
-        self.assertIn("book", entities)
-        book = entities["book"]
+        book = get_entity(recognition, "book")
+        self.assertIsNotNone(book)
         self.assertEqual(book.value, "the hound of the baskervilles")
 
-        self.assertIn("zone", entities)
-        zone = entities["zone"]
+        zone = get_entity(recognition, "zone")
+        self.assertIsNotNone(zone)
         self.assertEqual(zone.value, "bedroom")
 
     def test_converters_in_entities(self):
         """Check sentence with converters inside an entity."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is a test (ten:10!int){number}
         """
         )
 
-        graph = intents_to_graph(intents)
-
         # ten -> 10 (int)
-        recognitions = zero_times(recognize("this is a test ten", graph, fuzzy=False))
+        recognitions = recognize_strict("this is a test ten", graph)
 
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
         self.assertTrue(recognition.intent)
 
-        entities = {e.entity: e for e in recognition.entities}
-        self.assertIn("number", entities)
-        number = entities["number"]
+        number = get_entity(recognition, "number")
+        self.assertIsNotNone(number)
         self.assertEqual(number.value, 10)
 
     def test_entity_converter(self):
         """Check sentence with an entity converter."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is a test (four: point: two:4.2){number!float}
         """
         )
 
-        graph = intents_to_graph(intents)
-
         # "four point two" -> 4.2
-        recognitions = zero_times(
-            recognize("this is a test four point two", graph, fuzzy=False)
-        )
+        recognitions = recognize_strict("this is a test four point two", graph)
 
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
         self.assertTrue(recognition.intent)
 
-        entities = {e.entity: e for e in recognition.entities}
-        self.assertIn("number", entities)
-        number = entities["number"]
+        number = get_entity(recognition, "number")
+        self.assertIsNotNone(number)
         self.assertEqual(number.value, 4.2)
 
     def test_entity_converters_both(self):
         """Check sentence with an entity converter and a converter inside the entity."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is a test (four:4 point: two:2){number!floatify}
         """
         )
 
-        graph = intents_to_graph(intents)
-
         # "four two" -> 4.2
-        recognitions = zero_times(
-            recognize(
-                "this is a test four point two",
-                graph,
-                fuzzy=False,
-                extra_converters={"floatify": lambda a, b: [float(f"{a}.{b}")]},
-            )
+        recognitions = recognize_strict(
+            "this is a test four point two", graph, extra_converters=FLOATIFY_CONVERTERS
         )
 
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
         self.assertTrue(recognition.intent)
 
-        entities = {e.entity: e for e in recognition.entities}
-        self.assertIn("number", entities)
-        number = entities["number"]
+        number = get_entity(recognition, "number")
+        self.assertIsNotNone(number)
         self.assertEqual(number.value, 4.2)
 
     def test_sequence_converters(self):
         """Check sentence with sequence converters."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this (is a test)!upper
         """
         )
 
-        graph = intents_to_graph(intents)
-
         # Should upper-case "is a test"
-        recognitions = zero_times(recognize("this is a test", graph, fuzzy=False))
+        recognitions = recognize_strict("this is a test", graph)
         self.assertEqual(
             recognitions,
             [
@@ -585,7 +500,7 @@ class MiscellaneousTestCase(unittest.TestCase):
                     text="this IS A TEST",
                     raw_text="this is a test",
                     tokens=["this", "IS", "A", "TEST"],
-                    raw_tokens=["this", "is", "a", "test"],
+                    raw_tokens=TEST_TOKENS,
                 )
             ],
         )
@@ -606,7 +521,7 @@ class MiscellaneousTestCase(unittest.TestCase):
         graph = intents_to_graph(parse_ini(ini_text), replacements)
 
         for text in ["play me rock", "play me hard rock"]:
-            recognitions = zero_times(recognize(text, graph, fuzzy=False))
+            recognitions = recognize_strict(text, graph)
             self.assertEqual(len(recognitions), 1)
             recognition = recognitions[0]
             self.assertIsNotNone(recognition.intent)
@@ -619,7 +534,7 @@ class MiscellaneousTestCase(unittest.TestCase):
             genre = recognition.entities[0]
             self.assertEqual(genre.source, "music_genre")
 
-        recognitions = zero_times(recognize("play me classical", graph, fuzzy=False))
+        recognitions = recognize_strict("play me classical", graph)
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
         self.assertIsNotNone(recognition.intent)
@@ -639,10 +554,10 @@ class MiscellaneousTestCase(unittest.TestCase):
         this is a (test){value}
         """
 
-        graph = intents_to_graph(parse_ini(ini_text))
+        graph = get_graph(ini_text)
 
-        recognitions = zero_times(
-            recognize("this is a TEST", graph, fuzzy=False, word_transform=str.lower)
+        recognitions = recognize_strict(
+            "this is a TEST", graph, word_transform=str.lower
         )
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
@@ -668,8 +583,8 @@ class MiscellaneousTestCase(unittest.TestCase):
         replacements = {"$test": [Sentence.parse("Bar")]}
         graph = intents_to_graph(parse_ini(ini_text), replacements)
 
-        recognitions = zero_times(
-            recognize("this is a bar", graph, fuzzy=False, word_transform=str.lower)
+        recognitions = recognize_strict(
+            "this is a bar", graph, word_transform=str.lower
         )
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
@@ -694,22 +609,20 @@ class MiscellaneousTestCase(unittest.TestCase):
         display (top | bottom){location} [(page | layer){layout}]
         """
 
-        graph = intents_to_graph(parse_ini(ini_text))
+        graph = get_graph(ini_text)
 
-        recognitions = zero_times(recognize("display bottom layer", graph))
+        recognitions = recognize_fuzzy("display bottom layer", graph)
 
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
         self.assertIsNotNone(recognition.intent)
 
-        entities = {e.entity: e for e in recognition.entities}
-
-        self.assertIn("location", entities)
-        location = entities["location"]
+        location = get_entity(recognition, "location")
+        self.assertIsNotNone(location)
         self.assertEqual(location.value, "bottom")
 
-        self.assertIn("layout", entities)
-        layout = entities["layout"]
+        layout = get_entity(recognition, "layout")
+        self.assertIsNotNone(layout)
         self.assertEqual(layout.value, "layer")
 
     def test_slot_case_inside_substitution(self):
@@ -722,8 +635,8 @@ class MiscellaneousTestCase(unittest.TestCase):
         replacements = {"$test": [Sentence.parse("(Bar:bar | Baz:baz):barorbaz")]}
         graph = intents_to_graph(parse_ini(ini_text), replacements)
 
-        recognitions = zero_times(
-            recognize("this is a bar", graph, fuzzy=False, word_transform=str.lower)
+        recognitions = recognize_strict(
+            "this is a bar", graph, word_transform=str.lower
         )
         self.assertEqual(len(recognitions), 1)
         recognition = recognitions[0]
@@ -744,9 +657,11 @@ class MiscellaneousTestCase(unittest.TestCase):
 # -----------------------------------------------------------------------------
 
 
-def zero_times(recognitions):
-    """Set times to zero so they can be easily compared in assertions"""
-    for recognition in recognitions:
-        recognition.recognize_seconds = 0
+def get_entity(recognition, name):
+    """Get first entity with a given name (or None)"""
+    return next((e for e in recognition.entities if e.entity == name), None)
+
 
-    return recognitions
+def intent_name(recognition):
+    """Sort key for recognitions by intent name"""
+    return recognition.intent.name
@@ -24,13 +24,21 @@ t}T e}EH s}S t}T
 class SoundsLikeTests(unittest.TestCase):
     """Test cases for sounds like pronunciations."""
 
-    def setUp(self):
-        """Set up tests"""
+    @classmethod
+    def setUpClass(cls):
+        """Parse dictionary and alignment corpus once"""
         with io.StringIO(_DICTIONARY) as dict_file:
-            self.pronunciations = read_pronunciations(dict_file)
+            cls.base_pronunciations = read_pronunciations(dict_file)
 
         with io.StringIO(_ALIGNMENT) as corpus_file:
-            self.g2p_alignment = load_g2p_corpus(corpus_file)
+            cls.g2p_alignment = load_g2p_corpus(corpus_file)
+
+    def setUp(self):
+        """Set up tests"""
+        # Tests add pronunciations, so give each one its own copy
+        self.pronunciations = {
+            word: list(prons) for word, prons in self.base_pronunciations.items()
+        }
 
     def test_known_words(self):
         """Test pronunciation from known words."""
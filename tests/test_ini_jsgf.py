@@ -1,9 +1,20 @@
 """Test cases for ini/JSGF grammar parser."""
+import copy
 import unittest
 
 from rhasspynlu.ini_jsgf import get_intent_counts, parse_ini, split_rules
 from rhasspynlu.jsgf import Sentence, Sequence, SequenceType, Tag, Word, walk_expression
 
+# Parsed once; test_walk deep copies these since walk_expression mutates them
+_WALK_INTENTS = parse_ini(
+    """
+    [SetAlarm]
+    minutes = $minute minutes
+    set alarm for <minutes>
+    """
+)
+_MINUTE_SENTENCE = Sentence.parse("2 | 3")
+
 
 class IniJsgfTestCase(unittest.TestCase):
     """Test cases for ini/JSGF grammar parser."""
@@ -132,15 +143,8 @@ class IniJsgfTestCase(unittest.TestCase):
 
     def test_walk(self):
         """Test Expression.walk with rule and slot reference."""
-        ini_text = """
-        [SetAlarm]
-        minutes = $minute minutes
-        set alarm for <minutes>
-        """
-
-        intents = parse_ini(ini_text)
-        sentences, replacements = split_rules(intents)
-        replacements["$minute"] = [Sentence.parse("2 | 3")]
+        sentences, replacements = split_rules(copy.deepcopy(_WALK_INTENTS))
+        replacements["$minute"] = [copy.deepcopy(_MINUTE_SENTENCE)]
 
         def num2words(word):
             if not isinstance(word, Word):
@@ -243,6 +247,17 @@ class IniJsgfTestCase(unittest.TestCase):
             for sentence in sentences:
                 walk_expression(sentence, lambda x: x, replacements)
 
+    def test_parse_workers(self):
+        """Test ini parsing with a process pool."""
+        ini_text = "\n".join(
+            f"[TestIntent{i}]\nrule = a test\nthis is <rule> {i}\n" for i in range(10)
+        )
+
+        intents = parse_ini(ini_text)
+        parallel_intents = parse_ini(ini_text, workers=2)
+
+        self.assertEqual(intents, parallel_intents)
+
 
 # -----------------------------------------------------------------------------
 
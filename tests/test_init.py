@@ -0,0 +1,33 @@
+"""Test cases for package-level imports."""
+import subprocess
+import sys
+import unittest
+
+import rhasspynlu
+
+
+class PackageTestCase(unittest.TestCase):
+    """Test cases for lazily imported package attributes."""
+
+    def run_fresh(self, code):
+        """Run code in a fresh interpreter (nothing imported yet)."""
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_submodule_attribute(self):
+        """Test submodules are available as package attributes."""
+        self.run_fresh("import rhasspynlu; rhasspynlu.intent.Recognition")
+
+    def test_public_name(self):
+        """Test public names are available as package attributes."""
+        self.run_fresh("import rhasspynlu; rhasspynlu.parse_ini")
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes still raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            rhasspynlu.not_a_submodule  # pylint: disable=pointless-statement
+
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -127,6 +127,25 @@ class BasicJsgfTestCase(unittest.TestCase):
         expected_count = 2 * 2 * 2 * 2
         self.assertEqual(get_expression_count(s), expected_count)
 
+    def test_expression_count_replacements(self):
+        """Test counting expressions with rule and slot references."""
+        s = Sentence.parse("<rule> $slot [test]")
+        replacements = {
+            "<rule>": [Sentence.parse("(a | b | c)")],
+            "$slot": [Sentence.parse("d"), Sentence.parse("e [f]")],
+        }
+
+        # Slots are excluded by default
+        self.assertEqual(get_expression_count(s, replacements), 0)
+        self.assertEqual(
+            get_expression_count(s, replacements, exclude_slots=False), 3 * 3 * 2
+        )
+
+        # Recursive rule
+        replacements["<rule>"] = [Sentence.parse("a [<rule>]")]
+        with self.assertRaises(RecursionError):
+            get_expression_count(s, replacements)
+
     def test_word_converters(self):
         """Test multiple converters on a single word"""
         s = Sentence.parse("this is a test!c1!c2")
@@ -302,6 +321,23 @@ class AdvancedJsgfTestCase(unittest.TestCase):
             ],
         )
 
+    def test_flatten(self):
+        """Test flattening of single-item groups."""
+        s = Sentence.parse("a ((b)) ((c)){tag}", flatten=True)
+        self.assertEqual(
+            s.items,
+            [
+                Word("a"),
+                Word("b"),
+                Sequence(
+                    text="(c)",
+                    type=SequenceType.GROUP,
+                    items=[Word("c")],
+                    tag=Tag(tag_text="tag"),
+                ),
+            ],
+        )
+
     def test_implicit_sequences(self):
         """Implicit sequences around alternative."""
         s = Sentence.parse("this is | a test")
@@ -491,6 +527,31 @@ class OtherJsgfTestCase(unittest.TestCase):
             ],
         )
 
+    def test_walk_replacements(self):
+        """Test walk_expression order through rule and slot references."""
+        s = Sentence.parse("<rule> $slot (skip me) end")
+        replacements = {
+            "<rule>": [Sentence.parse("a b")],
+            "$slot": [Sentence.parse("c"), Sentence.parse("d")],
+        }
+
+        visited = []
+
+        def visit(expression):
+            if isinstance(expression, Word):
+                visited.append(expression.text)
+            elif isinstance(expression, Sequence) and (expression.text == "skip me"):
+                # Don't descend
+                return False
+
+        walk_expression(s, visit, replacements)
+        self.assertEqual(visited, ["a", "b", "c", "d", "end"])
+
+        # Recursive rule
+        replacements["<rule>"] = [Sentence.parse("a [<rule>]")]
+        with self.assertRaises(RecursionError):
+            walk_expression(s, visit, replacements)
+
     def test_sequence_substition_in_alternative(self):
         """Test sequence substitution inside an alternative."""
         s = Sentence.parse(
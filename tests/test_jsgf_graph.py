@@ -10,20 +10,30 @@ from rhasspynlu.jsgf_graph import (
     intents_to_graph,
 )
 
+from . import get_graph
+
+# Grammars shared by several tests
+SINGLE_INTENT_INI = """
+[TestIntent]
+this is a test
+"""
+
+TWO_INTENTS_INI = """
+[TestIntent1]
+this is a test
+
+[TestIntent2]
+this is another test
+"""
+
 
 class FstTestCase(unittest.TestCase):
     """Test cases for OpenFST conversion."""
 
     def test_single_sentence(self):
         """Test one intent, one sentence."""
-        intents = parse_ini(
-            """
-        [TestIntent]
-        this is a test
-        """
-        )
+        graph = get_graph(SINGLE_INTENT_INI)
 
-        graph = intents_to_graph(intents)
         fsts = graph_to_fsts(graph)
         self.assertEqual(
             fsts,
@@ -44,14 +54,13 @@ class FstTestCase(unittest.TestCase):
 
     def test_substitution(self):
         """Test one intent, one sentence with a substitution."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is a test:sub
         """
         )
 
-        graph = intents_to_graph(intents)
         fsts = graph_to_fsts(graph)
         self.assertEqual(
             fsts,
@@ -73,14 +82,13 @@ class FstTestCase(unittest.TestCase):
 
     def test_optional(self):
         """Test one intent, one sentence with an optional word."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent]
         this is [a] test
         """
         )
 
-        graph = intents_to_graph(intents)
         fsts = graph_to_fsts(graph)
         self.assertEqual(
             fsts,
@@ -104,17 +112,8 @@ class FstTestCase(unittest.TestCase):
 
     def test_multiple_sentences(self):
         """Test multiple intents."""
-        intents = parse_ini(
-            """
-        [TestIntent1]
-        this is a test
+        graph = get_graph(TWO_INTENTS_INI)
 
-        [TestIntent2]
-        this is another test
-        """
-        )
-
-        graph = intents_to_graph(intents)
         fsts = graph_to_fsts(graph)
         self.assertEqual(
             fsts,
@@ -164,14 +163,8 @@ class FstTestCase(unittest.TestCase):
 
     def test_one_weight(self):
         """Single intent should have an edge weight of 0."""
-        intents = parse_ini(
-            """
-        [TestIntent]
-        this is a test
-        """
-        )
+        graph = get_graph(SINGLE_INTENT_INI)
 
-        graph = intents_to_graph(intents)
         fst = graph_to_fst(graph)
         self.assertEqual(
             fst,
@@ -205,7 +198,7 @@ class FstTestCase(unittest.TestCase):
 
     def test_multiple_weights(self):
         """Multiple intents should have balanced weights."""
-        intents = parse_ini(
+        graph = get_graph(
             """
         [TestIntent1]
         this is a test
@@ -215,7 +208,6 @@ class FstTestCase(unittest.TestCase):
         """
         )
 
-        graph = intents_to_graph(intents)
         fst = graph_to_fst(graph)
         print(fst)
         self.assertEqual(
@@ -260,17 +252,8 @@ class FstTestCase(unittest.TestCase):
 
     def test_intent_filter_single_fst(self):
         """Test multiple intents, single FST with an intent filter."""
-        intents = parse_ini(
-            """
-        [TestIntent1]
-        this is a test
+        graph = get_graph(TWO_INTENTS_INI)
 
-        [TestIntent2]
-        this is another test
-        """
-        )
-
-        graph = intents_to_graph(intents)
         fst = graph_to_fst(graph, intent_filter=lambda intent: intent == "TestIntent1")
         print(fst)
         self.assertEqual(
@@ -305,17 +288,8 @@ class FstTestCase(unittest.TestCase):
 
     def test_intent_filter_multiple_fsts(self):
         """Test multiple intents, multiple FSTs with an intent filter."""
-        intents = parse_ini(
-            """
-        [TestIntent1]
-        this is a test
-
-        [TestIntent2]
-        this is another test
-        """
-        )
+        graph = get_graph(TWO_INTENTS_INI)
 
-        graph = intents_to_graph(intents)
         fsts = graph_to_fsts(
             graph, intent_filter=lambda intent: intent == "TestIntent1"
         )